@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+# pylint: disable=invalid-name
+V = TypeVar("V")
+
+
+# thread-safe cache whose entries expire after ttl seconds; once maxsize entries are stored, the oldest one is evicted.
+# values are loaded outside the lock, so concurrent misses for the same key may load it more than once
+class TTLCache(Generic[V]):
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__entries: dict[Hashable, tuple[float, V]] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Hashable, loader: Callable[[], Optional[V]]) -> Optional[V]:
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    return entry[1]
+                del self.__entries[key]
+        value = loader()
+        # don't remember misses, the value may well exist the next time it's asked for
+        if value is not None:
+            with self.__lock:
+                self.__entries.pop(key, None)
+                while len(self.__entries) >= self.maxsize:
+                    del self.__entries[next(iter(self.__entries))]
+                self.__entries[key] = (now + self.ttl, value)
+        return value
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
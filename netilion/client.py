@@ -1,27 +1,47 @@
-import enum
-import json
 import logging
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
 
 import oauthlib.oauth2
 from oauthlib.oauth2 import LegacyApplicationClient
+from oauthlib.oauth2.rfc6749.errors import MissingTokenError, raise_from_error
+from requests import RequestException
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
+from urllib3.util.retry import Retry
 
+from . import codec
+from .cache import TTLCache
 from .config import ConfigurationParameters
-from .error import MalformedNetilionApiRequest, InvalidNetilionApiState, MalformedNetilionApiResponse
+from .error import MalformedNetilionApiRequest, InvalidNetilionApiState, MalformedNetilionApiResponse, \
+    GenericNetilionApiError, PartialNetilionApiFailure
 from .model import ClientApplication, WebHook, Asset, AssetValue, Unit, AssetValues, AssetValuesByKey, AssetSystem, \
     AssetHealthCondition, Pagination, NodeSpecification, Document, DocumentClassification, DocumentStatus, Attachment, \
     Specification, Node
 
+# pylint: disable=invalid-name
+T = TypeVar("T")
+R = TypeVar("R")
 
-class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-public-methods
+
+class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     logger = logging.getLogger(__name__)
     request_timing_logger = logging.getLogger(f"{__name__}.timing")
-    __configuration: ConfigurationParameters = None
+    _cfg: ConfigurationParameters = None
     __my_application: ClientApplication = None
-
-    class ENDPOINT(enum.Enum):
+    # point in time (epoch seconds) from which the token is refreshed, i.e. its expiry minus the skew; 0 without a token
+    __token_refresh_at: float = 0.0
+    # refresh tokens slightly before they expire instead of running into a 401
+    TOKEN_EXPIRY_SKEW_SECONDS = 30
+    TOKEN_REQUEST_HEADERS = {"Accept": "application/json"}
+    # units are reference data that practically never change, so lookups are cached per client
+    UNIT_CACHE_MAX_SIZE = 1024
+    UNIT_CACHE_TTL_SECONDS = 3600
+
+    class ENDPOINT:  # pylint: disable=too-few-public-methods
+        # plain strings rather than an enum, there's no need for an Enum lookup and .value on every request
         UNITS = "/units"
         UNIT = "/units/{unit_id}"
         ASSETS = "/assets"
@@ -48,120 +68,224 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
         NODE_ASSETS = "/nodes/{node_id}/assets"
 
     def __init__(self, configuration: ConfigurationParameters):
-        self.__configuration = configuration
-        self.logger.debug(f"Starting Netilion client (-> {self.__configuration.endpoint}): {self.__configuration.client_application_name or 'name n/a'}, {self.__configuration.client_id or 'id n/a'}")
-        super().__init__(client=LegacyApplicationClient(self.__configuration.client_id))
-
-        def set_api_header(url, headers, data=None):
-            # this is required by the Netilion API
-            if not headers:  # pragma: no cover
-                headers = {}
-            headers["Api-Key"] = self.__configuration.client_id
-            return url, headers, data
-
-        self.register_compliance_hook("protected_request", set_api_header)
-
-    def construct_url(self, endpoint: ENDPOINT, values: dict = None) -> str:
-        raw = f"{self.__configuration.api_url}{endpoint.value}"
+        self._cfg = configuration
+        # scalars used on every request, kept as plain attributes rather than read through the configuration each time
+        self._endpoint = configuration.endpoint
+        self._oauth_token_url = configuration.oauth_token_url
+        self._client_id = configuration.client_id
+        self.logger.debug(f"Starting Netilion client (-> {self._cfg.endpoint}): {self._cfg.client_application_name or 'name n/a'}, {self._cfg.client_id or 'id n/a'}")
+        super().__init__(client=LegacyApplicationClient(self._client_id))
+        self.__token_lock = threading.Lock()
+        self.__application_lock = threading.Lock()
+        self.__units_by_id = TTLCache(self.UNIT_CACHE_MAX_SIZE, self.UNIT_CACHE_TTL_SECONDS)
+        self.__units_by_code = TTLCache(self.UNIT_CACHE_MAX_SIZE, self.UNIT_CACHE_TTL_SECONDS)
+        self.__token_body = {"grant_type": "password", "username": configuration.username, "password": configuration.password,
+                             "client_id": configuration.client_id, "client_secret": configuration.client_secret}
+        # endpoint paths never change for a client, so resolve them against the API url only once
+        self.__url_templates = {endpoint: f"{self._cfg.api_url}{endpoint}"
+                                for name, endpoint in vars(self.ENDPOINT).items() if name.isupper()}
+
+        # parameter-free endpoints don't need construct_url at all
+        self._static_urls = {endpoint: url for endpoint, url in self.__url_templates.items() if "{" not in endpoint}
+
+        # size the connection pool for concurrent use and retry transient gateway errors on idempotent requests; the
+        # last response is still handed back (instead of raising a RetryError) so the usual status checks apply
+        adapter = HTTPAdapter(pool_connections=self._cfg.pool_connections,
+                              pool_maxsize=self._cfg.pool_maxsize,
+                              pool_block=False,
+                              max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                                                raise_on_status=False))
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        # this is required by the Netilion API; it never changes, so set it once instead of in a per-request hook
+        self.headers["Api-Key"] = self._client_id
+
+    def construct_url(self, endpoint: str, values: dict = None) -> str:
+        template = self.__url_templates[endpoint]
         if values:
-            formatted = raw.format(**values)
-            return formatted
+            return template.format_map(values)
         else:
-            return raw
+            return template
+
+    @staticmethod
+    def _json(response) -> dict:
+        return codec.loads(response.content)
+
+    @staticmethod
+    def _json_stream(response) -> dict:
+        # for large bodies (requested with stream=True): collect the chunks in one buffer and decode that in place,
+        # instead of having requests join them into yet another copy of the body first
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buffer.extend(chunk)
+        return codec.loads(memoryview(buffer))
+
+    def _expect_status(self, response, expected: int = 204, error: Optional[type[GenericNetilionApiError]] = None) -> None:
+        # raises error if given, otherwise an exception depending on whether the request or the server is to blame
+        status_code = response.status_code
+        if status_code == expected:
+            return
+        self.logger.error(f"Received bad server response: {status_code}")
+        if error is not None:
+            raise error(response)
+        if 400 <= status_code < 500:
+            raise MalformedNetilionApiRequest(response)
+        raise InvalidNetilionApiState(response)
+
+    @classmethod
+    def _parse(cls, response, parser: Callable[..., R], key: Optional[str] = None) -> R:
+        # parse errors simply propagate to the caller, there's nothing to add to them here
+        if key:
+            return parser(cls._json(response), key)
+        return parser(cls._json(response))
 
     # pylint: disable=arguments-differ
     def request(self, method, url, **kwargs):
-        if not url.startswith(self.__configuration.endpoint):
+        if kwargs.get("json") is not None:
+            # encode JSON bodies ourselves, which is a lot cheaper than the stdlib encoder used by requests
+            kwargs["data"] = codec.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**codec.JSON_HEADERS, **(kwargs.get("headers") or {})}
+        # URLs built by construct_url are known to point to the API, only validate those passed in from outside
+        if kwargs.pop("_trusted", False):
+            self._ensure_token()
+        elif not url.startswith(self._endpoint):
             raise RuntimeError(f"Bad request to {url} - not a Netilion URL")
-        if url == self.__configuration.oauth_token_url:
+        elif url == self._oauth_token_url:
             # don't try to obtain tokens when trying to fetch tokens
             return super().request(method, url, **kwargs)
         else:
-            if not self.token:
-                self.fetch_token()
-            else:
-                token_expiry = self.token["created_at"] + self.token["expires_in"]
-                token_expired = token_expiry <= time.time()
-                if token_expired:
-                    self.logger.info(f"Refreshing token (expired {int(time.time()) - token_expiry} seconds ago)")
-                    self.refresh_token()
-                else:  # pragma: no cover
-                    self.logger.debug(f"Access token still valid for {token_expiry - int(time.time())} seconds")
+            self._ensure_token()
 
         # go back to the original request
         return super().request(method, url, **kwargs)
 
+    @property
+    def token(self):
+        return OAuth2Session.token.fget(self)
+
+    @token.setter
+    def token(self, value):
+        OAuth2Session.token.fset(self, value)
+        # keep the expiry in sync however the token is set (fetch, refresh, or assigned by the caller)
+        if not value:
+            self.__token_refresh_at = 0.0
+            return
+        if "expires_in" in value:
+            # Netilion tokens carry their creation time; for tokens without one assume they were issued just now
+            expiry = value.get("created_at", time.time()) + int(value["expires_in"])
+        else:
+            expiry = float(value.get("expires_at", 0.0))
+        self.__token_refresh_at = expiry - self.TOKEN_EXPIRY_SKEW_SECONDS
+
+    def _token_expired(self) -> bool:
+        return self.__token_refresh_at <= time.time()
+
+    def _ensure_token(self) -> None:
+        # hot path: a single float comparison (the refresh time is 0 as long as there's no token)
+        if time.time() < self.__token_refresh_at:
+            return
+        with self.__token_lock:
+            # another thread may have obtained a token while we were waiting for the lock
+            if not self.token:
+                self.fetch_token()
+            elif self._token_expired():
+                expires_in = int(self.__token_refresh_at + self.TOKEN_EXPIRY_SKEW_SECONDS - time.time())
+                self.logger.info(f"Refreshing token (expires in {expires_in} seconds)")
+                self.refresh_token()
+
     # pylint: disable=arguments-differ
-    def fetch_token(self, **kwargs) -> oauthlib.oauth2.OAuth2Token:
+    def fetch_token(self, **kwargs) -> dict:
+        # the password grant body never changes, so post it directly instead of having oauthlib build and validate it
         self.logger.info("Getting new access token")
-        return super().fetch_token(token_url=self.__configuration.oauth_token_url, username=self.__configuration.username,
-                                   password=self.__configuration.password, client_secret=self.__configuration.client_secret,
-                                   include_client_id=True, **kwargs)
+        response = self.post(self._oauth_token_url, data=self.__token_body, headers=self.TOKEN_REQUEST_HEADERS, **kwargs)
+        token = self._json(response)
+        if "error" in token:
+            raise_from_error(token["error"], token)
+        if "access_token" not in token:
+            raise MissingTokenError(description="Missing access token parameter.")
+        token.setdefault("created_at", time.time())
+        self.token = token
+        return token
 
     def refresh_token(self, **kwargs) -> oauthlib.oauth2.OAuth2Token:
         self.logger.info("Refreshing token")
-        kwargs["client_id"] = self.__configuration.client_id
-        kwargs["client_secret"] = self.__configuration.client_secret
-        return super().refresh_token(self.__configuration.oauth_token_url, **kwargs)
+        kwargs["client_id"] = self._client_id
+        kwargs["client_secret"] = self._cfg.client_secret
+        token = super().refresh_token(self._oauth_token_url, **kwargs)
+        return token
 
     def get(self, url, **kwargs):
-        start = time.time()
+        if not self.request_timing_logger.isEnabledFor(logging.DEBUG):
+            return super().get(url, **kwargs)
+        start = time.monotonic()
         resp = super().get(url, **kwargs)
-        end = time.time()
-        self.request_timing_logger.debug(f"GET to {url} took {end - start:.2f} seconds")
+        self.request_timing_logger.debug(f"GET to {url} took {time.monotonic() - start:.2f} seconds")
         return resp
 
     def post(self, url, **kwargs):
-        start = time.time()
+        if not self.request_timing_logger.isEnabledFor(logging.DEBUG):
+            return super().post(url, **kwargs)
+        start = time.monotonic()
         resp = super().post(url, **kwargs)
-        end = time.time()
-        self.request_timing_logger.debug(f"POST to {url} took {end - start:.2f} seconds")
+        self.request_timing_logger.debug(f"POST to {url} took {time.monotonic() - start:.2f} seconds")
         return resp
 
+    def map_concurrently(self, func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> list[R]:
+        # runs func for every item on a thread pool sharing this session's connection pool; results keep the item order
+        workers = max_workers or self._cfg.pool_maxsize
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
     def get_applications(self) -> list[ClientApplication]:
-        response = self.get(self.construct_url(self.ENDPOINT.CLIENT_APPLICATIONS))
-        return ClientApplication.parse_multiple_from_api(response.json(), "client_applications")
+        response = self.get(self._static_urls[self.ENDPOINT.CLIENT_APPLICATIONS], _trusted=True)
+        return self._parse(response, ClientApplication.parse_multiple_from_api, "client_applications")
 
     def get_my_application(self) -> ClientApplication:
         if self.__my_application:
             return self.__my_application
-        elif self.__configuration.client_application_id and self.__configuration.client_application_name:
-            return ClientApplication(self.__configuration.client_application_name, self.__configuration.client_application_id)
-        # we always expect this to return exactly one application since otherwise we'd get a permission denied error.
-        response = self.get(self.construct_url(self.ENDPOINT.CLIENT_APPLICATION_CURRENT))
-        app = ClientApplication.parse_from_api(response.json())
-        self.__my_application = app
-        self.logger.info(f"Determined this application to be {app}")
-        return app
+        with self.__application_lock:
+            # another thread may have determined the application while we were waiting for the lock
+            if self.__my_application:
+                return self.__my_application
+            if self._cfg.client_application_id and self._cfg.client_application_name:
+                app = ClientApplication(self._cfg.client_application_name, self._cfg.client_application_id)
+            else:
+                # we always expect this to return exactly one application since otherwise we'd get a permission denied error.
+                response = self.get(self._static_urls[self.ENDPOINT.CLIENT_APPLICATION_CURRENT], _trusted=True)
+                app = self._parse(response, ClientApplication.parse_from_api)
+                self.logger.info(f"Determined this application to be {app}")
+            self.__my_application = app
+            return app
 
     def get_application(self, application_id: int) -> ClientApplication:
-        response = self.get(self.construct_url(self.ENDPOINT.CLIENT_APPLICATION, {"application_id": application_id}))
-        return ClientApplication.parse_from_api(response.json())
+        response = self.get(self.construct_url(self.ENDPOINT.CLIENT_APPLICATION, {"application_id": application_id}), _trusted=True)
+        return self._parse(response, ClientApplication.parse_from_api)
 
     def get_assets(self) -> list[Asset]:
-        response = self.get(self.construct_url(self.ENDPOINT.ASSETS))
-        return Asset.parse_multiple_from_api(response.json(), "assets")
+        response = self.get(self._static_urls[self.ENDPOINT.ASSETS], _trusted=True)
+        return self._parse(response, Asset.parse_multiple_from_api, "assets")
 
     def get_asset(self, asset_id: int) -> Asset:
-        response = self.get(self.construct_url(self.ENDPOINT.ASSET, {"asset_id": asset_id}))
-        return Asset.parse_from_api(response.json())
+        response = self.get(self.construct_url(self.ENDPOINT.ASSET, {"asset_id": asset_id}), _trusted=True)
+        return self._parse(response, Asset.parse_from_api)
+
+    def get_assets_by_ids(self, asset_ids: list[int]) -> list[Asset]:
+        return self.map_concurrently(self.get_asset, asset_ids)
 
     def create_asset(self, asset_sn: str, product_id: int) -> Asset:
         body = {"serial_number": asset_sn, "product": {"id": product_id}}
-        response = self.post(self.construct_url(self.ENDPOINT.ASSETS), json=body)
-        return Asset.parse_from_api(response.json())
+        response = self.post(self._static_urls[self.ENDPOINT.ASSETS], json=body, _trusted=True)
+        return self._parse(response, Asset.parse_from_api)
 
     def delete_asset(self, asset_id: int) -> None:
-        response = self.delete(self.construct_url(self.ENDPOINT.ASSET, {"asset_id": asset_id}))
-        if 400 <= response.status_code < 500:
-            raise MalformedNetilionApiRequest(response)
-        elif response.status_code != 204:
-            raise InvalidNetilionApiState(response)
+        response = self.delete(self.construct_url(self.ENDPOINT.ASSET, {"asset_id": asset_id}), _trusted=True)
+        self._expect_status(response)
 
     def find_asset(self, serial_number: str) -> Optional[Asset]:
         query_params = {"serial_number": serial_number}
-        response = self.get(self.construct_url(self.ENDPOINT.ASSETS), params=query_params)
-        assets = Asset.parse_multiple_from_api(response.json(), "assets")
+        response = self.get(self._static_urls[self.ENDPOINT.ASSETS], params=query_params, _trusted=True)
+        assets = self._parse(response, Asset.parse_multiple_from_api, "assets")
         if len(assets) == 0:
             return None
         elif len(assets) > 1:
@@ -175,13 +299,16 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             # yes, permittable has a typo, but that's how it is in the API
             "permitable": {"id": asset_id, "type": "Asset"}
         }
-        response = self.post(self.construct_url(self.ENDPOINT.PERMISSIONS), json=body)
-        return response.status_code < 300 and "errors" not in response.json()
+        response = self.post(self._static_urls[self.ENDPOINT.PERMISSIONS], json=body, _trusted=True)
+        return response.status_code < 300 and "errors" not in self._json(response)
 
     def find_unit(self, unit_code: str) -> Optional[Unit]:
+        return self.__units_by_code.get(unit_code, lambda: self._find_unit(unit_code))
+
+    def _find_unit(self, unit_code: str) -> Optional[Unit]:
         query_params = {"code": unit_code}
-        response = self.get(self.construct_url(self.ENDPOINT.UNITS), params=query_params)
-        units = Unit.parse_multiple_from_api(response.json(), "units")
+        response = self.get(self._static_urls[self.ENDPOINT.UNITS], params=query_params, _trusted=True)
+        units = self._parse(response, Unit.parse_multiple_from_api, "units")
         if len(units) == 0:
             return None
         elif len(units) > 1:
@@ -189,97 +316,146 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
         return units[0]
 
     def get_unit(self, unit_id: int) -> Unit:
-        response = self.get(self.construct_url(self.ENDPOINT.UNIT, {"unit_id": unit_id}))
-        return Unit.parse_from_api(response.json())
+        return self.__units_by_id.get(unit_id, lambda: self._get_unit(unit_id))
+
+    def _get_unit(self, unit_id: int) -> Unit:
+        response = self.get(self.construct_url(self.ENDPOINT.UNIT, {"unit_id": unit_id}), _trusted=True)
+        return self._parse(response, Unit.parse_from_api)
 
     def get_asset_values(self, asset_id: int, per_page: int = 25) -> list[AssetValue]:
         url = self.construct_url(self.ENDPOINT.ASSET_VALUES, {"asset_id": asset_id})
-        response = self.get(url, params={"per_page": per_page})
-        return AssetValue.parse_multiple_from_api(response.json(), "values")
+        with self.get(url, params={"per_page": per_page}, stream=True, _trusted=True) as response:
+            return AssetValue.parse_multiple_from_api(self._json_stream(response), "values")
 
     def push_asset_values(self, asset_values: AssetValues):
         self.logger.info(f"POSTing asset values: {asset_values}")
         # we can remove the asset id here since that becomes part of the url
         asset_payload = {"values": asset_values.serialize().get("values", [])}
         self.logger.debug(asset_payload)
-        response = self.post(self.construct_url(self.ENDPOINT.ASSET_VALUES, {"asset_id": asset_values.asset.asset_id}), json=asset_payload)
+        response = self.post(self.construct_url(self.ENDPOINT.ASSET_VALUES, {"asset_id": asset_values.asset.asset_id}), json=asset_payload, _trusted=True)
         if response.status_code >= 300:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiResponse(response)
         else:
             self.logger.debug(f"POST confirmed: {response.status_code}")
 
+    def push_asset_values_bulk(self, batch: list[AssetValues]) -> None:
+        # merge everything destined for the same asset so that each asset only costs a single POST
+        merged: dict[int, AssetValues] = {}
+        units: dict[tuple, Unit] = {}
+        for asset_values in batch:
+            asset_id = asset_values.asset.asset_id
+            for asset_value in asset_values.values:
+                # a key is sent with a single unit, so merged values must agree on it
+                unit = units.setdefault((asset_id, asset_value.key), asset_value.unit)
+                if unit != asset_value.unit:
+                    raise MalformedNetilionApiRequest(msg=f"Conflicting units for key {asset_value.key} of asset {asset_id}: {unit}, {asset_value.unit}")
+            if asset_id in merged:
+                merged[asset_id].values.extend(asset_values.values)
+            else:
+                merged[asset_id] = AssetValues(asset_values.asset, list(asset_values.values))
+
+        def push(asset_values: AssetValues) -> Optional[Exception]:
+            try:
+                self.push_asset_values(asset_values)
+                return None
+            except (GenericNetilionApiError, RequestException) as err:
+                return err
+
+        # every asset is attempted, failures are reported together so that callers can retry just those assets
+        errors = self.map_concurrently(push, merged.values())
+        failures = {asset_id: error for asset_id, error in zip(merged, errors) if error is not None}
+        if failures:
+            raise PartialNetilionApiFailure(failures)
+
     def get_asset_values_history(self, asset_id: int, key: str, from_date: str, to_date: str, page: int = 1) -> (list[AssetValuesByKey], Pagination):  # pylint: disable=too-many-arguments
         url = self.construct_url(self.ENDPOINT.ASSET_VALUES_KEY, {"asset_id": asset_id, "key": key})
-        response = self.get(url, params={"from": from_date, "to": to_date, "page": page, "per_page": 1000})
-        asset_history = AssetValuesByKey.parse_multiple_from_api(response.json(), "data")
-        pagination = Pagination.parse_from_api(response.json())
+        params = {"from": from_date, "to": to_date, "page": page, "per_page": 1000}
+        with self.get(url, params=params, stream=True, _trusted=True) as response:
+            payload = self._json_stream(response)
+        asset_history = AssetValuesByKey.parse_multiple_from_api(payload, "data")
+        pagination = Pagination.parse_from_api(payload)
         return asset_history, pagination
 
+    def iter_asset_values_history(self, asset_id: int, key: str, from_date: str, to_date: str) -> Iterator[AssetValuesByKey]:
+        # fetches the next page in the background while the current one is consumed, hiding most of the round trips
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = 1
+            pending = executor.submit(self.get_asset_values_history, asset_id, key, from_date, to_date, page)
+            while pending:
+                # errors of a prefetched page surface here, i.e. once the previous page has been consumed
+                asset_history, pagination = pending.result()
+                if page < pagination.page_count:
+                    page += 1
+                    pending = executor.submit(self.get_asset_values_history, asset_id, key, from_date, to_date, page)
+                else:
+                    pending = None
+                yield from asset_history
+        finally:
+            # an abandoned iteration doesn't wait for an in-flight prefetch, its result is simply discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_last_asset_values(self, asset_id: int, key: str, to_date: str, from_date: Optional[str] = None) -> list[AssetValuesByKey]:
         params = {"to": to_date, "order_by": "-timestamp"}
         if from_date:
             params["from"] = from_date
         url = self.construct_url(self.ENDPOINT.ASSET_VALUES_KEY, {"asset_id": asset_id, "key": key})
-        response = self.get(url, params=params)
-        return AssetValuesByKey.parse_multiple_from_api(response.json(), "data")
+        response = self.get(url, params=params, _trusted=True)
+        return self._parse(response, AssetValuesByKey.parse_multiple_from_api, "data")
 
     def get_webhooks(self) -> list[WebHook]:
         application_id = self.get_my_application().api_id
-        response = self.get(self.construct_url(self.ENDPOINT.WEBHOOKS, {"application_id": application_id}))
-        return WebHook.parse_multiple_from_api(response.json(), "webhooks")
+        response = self.get(self.construct_url(self.ENDPOINT.WEBHOOKS, {"application_id": application_id}), _trusted=True)
+        return self._parse(response, WebHook.parse_multiple_from_api, "webhooks")
 
     def set_webhook(self, webhook: WebHook) -> WebHook:
         application_id = self.get_my_application().api_id
         webhook_payload = webhook.serialize()
-        response = self.post(self.construct_url(self.ENDPOINT.WEBHOOKS, {"application_id": application_id}), json=webhook_payload)
+        response = self.post(self.construct_url(self.ENDPOINT.WEBHOOKS, {"application_id": application_id}), json=webhook_payload, _trusted=True)
         if response.status_code >= 300:
             raise MalformedNetilionApiRequest(response)
-        return WebHook.parse_from_api(response.json())
+        return self._parse(response, WebHook.parse_from_api)
 
     def delete_webhook(self, webhook: WebHook) -> None:
         application_id = self.get_my_application().api_id
         url = self.construct_url(self.ENDPOINT.WEBHOOK, {"application_id": application_id, "webhook_id": webhook.api_id})
-        response = self.delete(url)
-        if response.status_code >= 300:
-            self.logger.error(f"Received bad server response: {response.status_code}")
-            raise MalformedNetilionApiResponse(response)
-        else:
-            self.logger.debug(f"DELETE confirmed: {response.status_code}")
+        response = self.delete(url, _trusted=True)
+        self._expect_status(response, error=MalformedNetilionApiResponse)
 
     def get_webhook(self, webhook_id: int) -> WebHook:
         application_id = self.get_my_application().api_id
-        response = self.get(self.construct_url(self.ENDPOINT.WEBHOOK, {"application_id": application_id, "webhook_id": webhook_id}))
-        return WebHook.parse_from_api(response.json())
+        response = self.get(self.construct_url(self.ENDPOINT.WEBHOOK, {"application_id": application_id, "webhook_id": webhook_id}), _trusted=True)
+        return self._parse(response, WebHook.parse_from_api)
 
     def get_asset_systems(self, asset_id: int) -> list[AssetSystem]:
         query_params = {"include": "specifications"}
-        response = self.get(self.construct_url(self.ENDPOINT.ASSET_SYSTEMS, {"asset_id": asset_id}), params=query_params)
-        return AssetSystem.parse_multiple_from_api(response.json(), "systems")
+        response = self.get(self.construct_url(self.ENDPOINT.ASSET_SYSTEMS, {"asset_id": asset_id}), params=query_params, _trusted=True)
+        return self._parse(response, AssetSystem.parse_multiple_from_api, "systems")
 
     def get_node_specifications(self, node_name: str) -> list[NodeSpecification]:
         query_params = {"name": node_name,
                         "include": "hidden,specifications"}
-        response = self.get(self.construct_url(self.ENDPOINT.NODES), params=query_params)
-        return NodeSpecification.parse_multiple_from_api(response.json(), "nodes")
+        response = self.get(self._static_urls[self.ENDPOINT.NODES], params=query_params, _trusted=True)
+        return self._parse(response, NodeSpecification.parse_multiple_from_api, "nodes")
 
     def post_node(self, node_name: str) -> NodeSpecification:
         node_body = {"name": node_name,
                      "hidden": "true"}
-        response = self.post(self.construct_url(self.ENDPOINT.NODES), json=node_body)
+        response = self.post(self._static_urls[self.ENDPOINT.NODES], json=node_body, _trusted=True)
         if response.status_code >= 300:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
         else:
             self.logger.debug(f"POST confirmed: {response.status_code}")
-            return NodeSpecification.parse_from_api(response.json())
+            return self._parse(response, NodeSpecification.parse_from_api)
 
     def patch_node_specification(self, node_id: int, specification_key: str, specification_value: str) -> None:
         specification_body = {specification_key: {
             "value": specification_value
         }}
         url = self.construct_url(self.ENDPOINT.NODES_SPECIFICATIONS, {"node_id": node_id})
-        response = self.patch(url, json=specification_body)
+        response = self.patch(url, json=specification_body, _trusted=True)
         if response.status_code >= 300:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
@@ -288,18 +464,18 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
 
     def get_asset_specifications(self, asset_id: int) -> list[Specification]:
         url = self.construct_url(self.ENDPOINT.ASSET_SPECIFICATIONS, {"asset_id": asset_id})
-        response = self.get(url)
+        response = self.get(url, _trusted=True)
         if response.status_code != 200:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
-        return Specification.parse_dict_from_api(response.json())
+        return self._parse(response, Specification.parse_dict_from_api)
 
     def patch_asset_specifications(self, asset_id: int, specifications: list[Specification]) -> None:
         url = self.construct_url(self.ENDPOINT.ASSET_SPECIFICATIONS, {"asset_id": asset_id})
         specification_body = {}
         for specification in specifications:
             specification_body |= specification.serialize()
-        response = self.patch(url, json=specification_body)
+        response = self.patch(url, json=specification_body, _trusted=True)
         if response.status_code != 204:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
@@ -307,12 +483,12 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             self.logger.debug(f"PATCH confirmed: {response.status_code}")
 
     def get_asset_health_conditions(self, asset_id: int) -> list[AssetHealthCondition]:
-        response = self.get(self.construct_url(self.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": asset_id}))
-        return AssetHealthCondition.parse_multiple_from_api(response.json(), "health_conditions")
+        response = self.get(self.construct_url(self.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": asset_id}), _trusted=True)
+        return self._parse(response, AssetHealthCondition.parse_multiple_from_api, "health_conditions")
 
     def get_asset_health_condition(self, health_condition_id: int) -> AssetHealthCondition:
-        response = self.get(self.construct_url(self.ENDPOINT.ASSET_HEALTH_CONDITION, {"health_condition_id": health_condition_id}))
-        return AssetHealthCondition.parse_from_api(response.json())
+        response = self.get(self.construct_url(self.ENDPOINT.ASSET_HEALTH_CONDITION, {"health_condition_id": health_condition_id}), _trusted=True)
+        return self._parse(response, AssetHealthCondition.parse_from_api)
 
     def post_asset_health_conditions(self, asset_id: int, health_conditions_id: list[int]) -> None:
         url = self.construct_url(self.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": asset_id})
@@ -320,7 +496,7 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             "health_conditions":
                 [{"id": health_condition_id} for health_condition_id in health_conditions_id]
         }
-        response = self.post(url, json=body)
+        response = self.post(url, json=body, _trusted=True)
         if response.status_code != 204:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
@@ -333,7 +509,7 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             "health_conditions":
                 [{"id": health_condition_id} for health_condition_id in health_conditions_id]
         }
-        response = self.delete(url, json=body)
+        response = self.delete(url, json=body, _trusted=True)
         if response.status_code != 204:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
@@ -344,13 +520,13 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
         url = self.construct_url(self.ENDPOINT.ASSET_DOCUMENTS, {"asset_id": asset_id})
         query_params = {"include": "attachments"}
 
-        response = self.get(url, params=query_params)
+        response = self.get(url, params=query_params, _trusted=True)
 
         if response.status_code != 200:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
         else:
-            return Document.parse_multiple_from_api(response.json(), "documents")
+            return self._parse(response, Document.parse_multiple_from_api, "documents")
 
     def post_asset_document(self, asset_id: int, document_id: int) -> None:
         url = self.construct_url(self.ENDPOINT.ASSET_DOCUMENTS, {"asset_id": asset_id})
@@ -360,7 +536,7 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             ]
         }
 
-        response = self.post(url, json=body)
+        response = self.post(url, json=body, _trusted=True)
 
         if response.status_code != 204:
             self.logger.error(f"Received bad server response: {response.status_code}")
@@ -369,51 +545,51 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
             self.logger.debug(f"POST confirmed: {response.status_code}")
 
     def post_document(self, name: str, classification: DocumentClassification, status: DocumentStatus) -> Document:
-        url = self.construct_url(self.ENDPOINT.DOCUMENTS)
+        url = self._static_urls[self.ENDPOINT.DOCUMENTS]
         body = {
             "name": name,
             "classification": {"id": classification.value},
             "status": {"id": status.value}
         }
 
-        response = self.post(url, json=body)
+        response = self.post(url, json=body, _trusted=True)
 
         if response.status_code != 201:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
         else:
             self.logger.debug(f"POST confirmed: {response.status_code}")
-            return Document.parse_from_api(response.json())
+            return self._parse(response, Document.parse_from_api)
 
     def download_json_attachment(self, attachment_id: int) -> dict:
         url = self.construct_url(self.ENDPOINT.ATTACHMENT_DOWNLOAD, {"attachment_id": attachment_id})
-        response = self.get(url)
+        response = self.get(url, _trusted=True)
 
         if response.status_code != 200:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
         else:
-            return json.loads(response.content)
+            return codec.loads(response.content)
 
     def upload_json_attachment(self, attachment: dict, attachment_name: str, document_id: int) -> Attachment:
-        url = self.construct_url(self.ENDPOINT.ATTACHMENTS)
-        files = {"file": (attachment_name, json.dumps(attachment)),
+        url = self._static_urls[self.ENDPOINT.ATTACHMENTS]
+        files = {"file": (attachment_name, codec.dumps(attachment)),
                  "type": "application/json",
                  "document_id": (None, document_id)}
 
-        response = self.post(url, files=files)
+        response = self.post(url, files=files, _trusted=True)
 
         if response.status_code != 201:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
         else:
-            return Attachment.parse_from_api(response.json())
+            return self._parse(response, Attachment.parse_from_api)
 
     def patch_json_attachment(self, attachment: dict, attachment_id: int, attachment_name: str) -> None:
         url = self.construct_url(self.ENDPOINT.ATTACHMENT, {"attachment_id": attachment_id})
-        file = {"file": (attachment_name, json.dumps(attachment)), "type": "application/json"}
+        file = {"file": (attachment_name, codec.dumps(attachment)), "type": "application/json"}
 
-        response = self.patch(url, files=file)
+        response = self.patch(url, files=file, _trusted=True)
 
         if response.status_code != 204:
             self.logger.error(f"Received bad server response: {response.status_code}")
@@ -423,18 +599,18 @@ class NetilionTechnicalApiClient(OAuth2Session):  # pylint: disable=too-many-pub
 
     def get_node_assets(self, node_id: int) -> list[Asset]:
         url = self.construct_url(self.ENDPOINT.NODE_ASSETS, {"node_id": node_id})
-        response = self.get(url)
+        response = self.get(url, _trusted=True)
         if response.status_code == 200:
-            return Asset.parse_multiple_from_api(response.json(), "assets")
+            return self._parse(response, Asset.parse_multiple_from_api, "assets")
         else:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
 
     def get_nodes(self) -> list[Node]:
-        url = self.construct_url(self.ENDPOINT.NODES)
-        response = self.get(url)
+        url = self._static_urls[self.ENDPOINT.NODES]
+        response = self.get(url, _trusted=True)
         if response.status_code == 200:
-            return Node.parse_multiple_from_api(response.json(), "nodes")
+            return self._parse(response, Node.parse_multiple_from_api, "nodes")
         else:
             self.logger.error(f"Received bad server response: {response.status_code}")
             raise MalformedNetilionApiRequest(response)
@@ -0,0 +1,46 @@
+import json
+import math
+from typing import Any, Union
+
+# orjson is an optional speedup; fall back to the standard library if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    # the output must not depend on whether orjson is installed, so fall back to the standard library wherever orjson
+    # would differ: integers beyond 64 bit (TypeError) and NaN/Infinity (which orjson silently turns into null)
+    if orjson is None:
+        return _stdlib_dumps(obj)
+    try:
+        encoded = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return _stdlib_dumps(obj)
+    # null is rare in our payloads, so the (slow) walk for non-finite floats only runs if there is one at all
+    if b"null" in encoded and _has_non_finite(obj):
+        return _stdlib_dumps(obj)
+    return encoded
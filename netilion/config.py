@@ -2,15 +2,9 @@ from typing import Optional
 
 
 class ConfigurationParameters:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
-    endpoint = None
-    client_application_id = None
-    client_application_name = None
-    client_id = None
-    client_secret = None
-    api_url = None
-    oauth_token_url = None
-    username = None
-    password = None
+    # a fixed set of plain attributes: no per-instance __dict__, and attribute access is a simple slot load
+    __slots__ = ("endpoint", "client_application_id", "client_application_name", "client_id", "client_secret", "api_url",
+                 "oauth_token_url", "username", "password", "pool_connections", "pool_maxsize")
 
     @classmethod
     def get_empty(cls):
@@ -26,7 +20,9 @@ class ConfigurationParameters:  # pylint: disable=too-few-public-methods,too-man
                  client_application_id: Optional[str] = None,
                  client_application_name: Optional[str] = None,
                  api_url: Optional[str] = None,
-                 oauth_token_url: Optional[str] = None):
+                 oauth_token_url: Optional[str] = None,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None):
         super().__init__()
         self.endpoint = endpoint
         self.client_id = client_id
@@ -37,3 +33,7 @@ class ConfigurationParameters:  # pylint: disable=too-few-public-methods,too-man
         self.client_application_name = client_application_name
         self.api_url = api_url or f"{endpoint}/v1/"
         self.oauth_token_url = oauth_token_url or f"{endpoint}/oauth/token/"
+        # connection pool sizes of the underlying HTTP adapter; the requests defaults (10/10) saturate quickly when
+        # the client is shared between threads
+        self.pool_connections = pool_connections or 20
+        self.pool_maxsize = pool_maxsize or 50
@@ -1,8 +1,10 @@
-import json
-from typing import Optional, Union
+from functools import cached_property
+from typing import Any, Optional, Union
 
 from requests import Response
 
+from . import codec
+
 
 class GenericNetilionApiError(Exception):
     __response: Optional[Response] = None
@@ -16,12 +18,22 @@ class GenericNetilionApiError(Exception):
             super().__init__()
         self.__response = response
 
+    @cached_property
+    def _parsed_body(self) -> Optional[Any]:
+        # parsed at most once, errors tend to be stringified several times (formatters, handlers, ...)
+        try:
+            if "json" not in self.__response.headers.get("Content-Type", ""):
+                return None
+            return codec.loads(self.__response.content)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
     def __str__(self) -> str:
         if self.__response is not None:
-            try:
-                return f"{self.__class__.__name__}: {self.__response.json()['errors']}"
-            except (AttributeError, json.JSONDecodeError, KeyError):
-                return f"{self.__class__.__name__}: {self.__response}"
+            body = self._parsed_body
+            if isinstance(body, dict) and "errors" in body:
+                return f"{self.__class__.__name__}: {body['errors']}"
+            return f"{self.__class__.__name__}: {self.__response}"
         else:
             return super().__str__()
 
@@ -44,3 +56,11 @@ class BadNetilionApiPermission(GenericNetilionApiError):
 
 class QuotaExceeded(GenericNetilionApiError):
     pass
+
+
+class PartialNetilionApiFailure(GenericNetilionApiError):
+    # raised by bulk operations after all items were attempted; failures maps each failed item's id to its error
+    def __init__(self, failures: dict) -> None:
+        super().__init__(msg=f"{len(failures)} request(s) failed: " +
+                             ", ".join(f"{item_id}: {error}" for item_id, error in failures.items()))
+        self.failures = failures
@@ -1,18 +1,93 @@
 from __future__ import annotations
 
+import functools
 import logging
-from datetime import datetime, timezone
-from enum import Enum
+import operator
+import sys
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from types import MappingProxyType
 from typing import TypeVar, Generic, Optional, Union
 
 from .error import MalformedNetilionApiResponse, BadNetilionApiPermission, GenericNetilionApiError, QuotaExceeded
 
+logger = logging.getLogger(__name__)
+
 # pylint: disable=invalid-name
 T = TypeVar("T")
 
+_UTC = timezone.utc
+_ALLOWED_UNITS = frozenset(map(sys.intern, (
+    "degree_celsius", "metre_per_second", "gram_per_cubic_centimetre", "percent_mass", "percent_volume", "degree_plato",
+    "percent", "millimetre", "millipascal_second", "percent_volume_per_hour", "fermentation_speed", "cubic_metre_per_second"
+)))
+
+# exceptions for known error types, in order of precedence if a response carries several; certainly others, extend as needed
+_ERRORS_BY_TYPE = {
+    "not_found_no_permission": lambda payload: BadNetilionApiPermission(),
+    "quota_exceeded": lambda payload: QuotaExceeded(msg=payload),
+}
+
+# shared by all models without specifications, read-only so that no instance can leak entries into another
+_NO_SPECIFICATIONS = MappingProxyType({})
+
+# required keys of the flat models, fetched in one C call each
+_client_application_keys = operator.itemgetter("name", "id")
+_pagination_keys = operator.itemgetter("page_count", "per_page", "page")
+_attachment_keys = operator.itemgetter("id", "file_name", "content_type")
+
+# UTC offsets seen so far; Netilion practically only sends "Z", so this stays tiny
+_utc_offsets = {"Z": _UTC}
+
+
+def _parse_utc_offset(offset: str) -> timezone:
+    tz = _utc_offsets.get(offset)
+    if tz is not None:
+        return tz
+    # +HH:MM or +HHMM, like strptime's %z
+    digits = offset[1:].replace(":", "", 1)
+    if offset[:1] not in ("+", "-") or len(digits) != 4 or not digits.isdigit():
+        raise ValueError(f"Unknown UTC offset: {offset!r}")
+    delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+    tz = timezone(-delta if offset[0] == "-" else delta)
+    _utc_offsets[offset] = tz
+    return tz
+
+
+def _serialize_timestamp(timestamp: datetime) -> str:
+    # isoformat truncates to milliseconds (Netilion's precision) in a single C call, a lot faster than strftime.
+    # since we convert to UTC first, the offset is always "+00:00" and can be swapped for the TZ code -- Z == "UTC"
+    return timestamp.astimezone(_UTC).isoformat(timespec="milliseconds")[:-6] + "Z"
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    # same result as strptime with "%Y-%m-%dT%H:%M:%S[.%f]%z", but slicing the fixed layout is a lot faster
+    if len(timestamp) < 20 or timestamp[4] + timestamp[7] + timestamp[10] + timestamp[13] + timestamp[16] != "--T::":
+        raise ValueError(f"Unknown datetime format: {timestamp!r}")
+    microsecond = 0
+    offset_start = 19
+    if timestamp[19] == ".":
+        if timestamp[-1] == "Z":
+            # what Netilion sends: the fraction runs up to the trailing Z, no need to look for where it ends
+            offset_start = len(timestamp) - 1
+        else:
+            offset_start = 20
+            while offset_start < len(timestamp) and timestamp[offset_start].isdigit():
+                offset_start += 1
+        fraction = timestamp[20:offset_start]
+        if not 1 <= len(fraction) <= 6 or not fraction.isdigit():
+            raise ValueError(f"Unknown datetime format: {timestamp!r}")
+        microsecond = int(fraction.ljust(6, "0"))
+    return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]), int(timestamp[11:13]),
+                    int(timestamp[14:16]), int(timestamp[17:19]), microsecond, _parse_utc_offset(timestamp[offset_start:]))
+
 
 class NetilionObject(Generic[T]):
-    logger = logging.getLogger(__name__)
+    # models are plain records, often created in bulk (e.g. values); subclasses declare __slots__ so instances carry no
+    # __dict__ and attribute access is a slot load
+    __slots__ = ()
+    # the module logger, still available as an attribute for backwards compatibility
+    logger = logger
 
     @classmethod
     def deserialize(cls, body) -> T:
@@ -25,51 +100,56 @@ class NetilionObject(Generic[T]):
     def raise_errors(cls, payload: dict) -> None:
         if "errors" not in payload:
             return
-        if not all("type" in error_entry for error_entry in payload["errors"]):
-            raise MalformedNetilionApiResponse(msg=payload)
-        error_types = [error["type"] for error in payload["errors"]]
-        # certainly others, extend as needed
-        if "not_found_no_permission" in error_types:
-            raise BadNetilionApiPermission()
-        elif "quota_exceeded" in error_types:
-            raise QuotaExceeded(msg=payload)
-        else:
-            raise GenericNetilionApiError(msg=payload)
+        error_types = set()
+        for error_entry in payload["errors"]:
+            if "type" not in error_entry:
+                raise MalformedNetilionApiResponse(msg=payload)
+            error_types.add(error_entry["type"])
+        for error_type, error in _ERRORS_BY_TYPE.items():
+            if error_type in error_types:
+                raise error(payload)
+        raise GenericNetilionApiError(msg=payload)
 
     @classmethod
     def parse_from_api(cls, response_body: dict) -> T:
         cls.raise_errors(response_body)
+        return cls._deserialize_unchecked(response_body)
+
+    @classmethod
+    def _deserialize_unchecked(cls, response_body: dict) -> T:
+        # parse_from_api without looking for errors, for items of a payload whose errors have already been checked
         try:
             return cls.deserialize(response_body)
         except KeyError as key_err:
-            cls.logger.warning(f"Unable to deserialize {cls.__name__}, missing key: {key_err} :: {response_body}")
+            # lazy formatting: the (possibly large) body is only turned into a string if the warning is actually emitted
+            logger.warning("Unable to deserialize %s, missing key: %s :: %s", cls.__name__, key_err, response_body)
             raise MalformedNetilionApiResponse from key_err
         except Exception as err:
-            cls.logger.error(err)
+            logger.error(err)
             raise
 
     @classmethod
     def parse_multiple_from_api(cls, response_body: dict, under_key: str) -> list[T]:
         cls.raise_errors(response_body)
         try:
-            return [cls.parse_from_api(response_item) for response_item in response_body[under_key]]
+            return [cls._deserialize_unchecked(response_item) for response_item in response_body[under_key]]
         except Exception as err:
-            cls.logger.error(err)
+            logger.error(err)
             raise MalformedNetilionApiResponse from err
 
     @classmethod
     def parse_dict_from_api(cls, response_body: dict) -> list[T]:
         cls.raise_errors(response_body)
         try:
-            return [cls.parse_from_api({key: value}) for key, value in response_body.items()]
+            return [cls._deserialize_unchecked({key: value}) for key, value in response_body.items()]
         except Exception as err:
-            cls.logger.error(err)
+            logger.error(err)
             raise MalformedNetilionApiResponse from err
 
 
 class ClientApplication(NetilionObject):
-    name: str = None
-    api_id = None
+    __slots__ = ("name", "api_id")
+    name: str
 
     def __init__(self, name, api_id):
         self.name = name
@@ -77,7 +157,7 @@ class ClientApplication(NetilionObject):
 
     @classmethod
     def deserialize(cls, body) -> T:
-        return cls(body["name"], body["id"])
+        return cls(*_client_application_keys(body))
 
     def serialize(self) -> dict:
         return {"name": self.name, "id": self.api_id}
@@ -86,20 +166,22 @@ class ClientApplication(NetilionObject):
         return f"Client Application \"{self.name}\""
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.name == other.name and self.api_id == other.api_id
+        # exact class first, a pointer compare; isinstance only runs for subclasses and non-matches
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
+            return (self.name, self.api_id) == (other.name, other.api_id)
         elif isinstance(other, dict):
-            return self.name == other.get("name") and self.api_id == other.get("id")
+            return (self.name, self.api_id) == (other.get("name"), other.get("id"))
         else:
             return False
 
 
 class WebHook(NetilionObject):
-    api_id = None
+    __slots__ = ("api_id", "url", "event_types", "secret")
+    # never set, read-only; kept for backwards compatibility
     webhook_id = None
-    url: str = None
-    event_types: list[str] = None
-    secret: str = None
+    url: str
+    event_types: list[str]
+    secret: str
 
     def __init__(self, url, event_types, api_id=None, secret=None):
         self.url = url
@@ -115,20 +197,20 @@ class WebHook(NetilionObject):
         return {"url": self.url, "event_types": self.event_types}
 
     def __str__(self):  # pragma: no cover
-        return f"WebHook <{self.url}> (events {','.join(event_type for event_type in self.event_types)})"
+        return f"WebHook <{self.url}> (events {','.join(self.event_types)})"
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.url == other.url and self.event_types == other.event_types
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
+            return (self.url, self.event_types) == (other.url, other.event_types)
         elif isinstance(other, dict):
-            return self.url == other.get("url") and self.event_types == other.get("event_types")
+            return (self.url, self.event_types) == (other.get("url"), other.get("event_types"))
         else:
             return False
 
 
 class Asset(NetilionObject):
-    asset_id = None
-    serial_number: str = None
+    __slots__ = ("asset_id", "serial_number")
+    serial_number: str
 
     def __init__(self, asset_id, serial_number=None):
         self.asset_id = asset_id
@@ -145,7 +227,7 @@ class Asset(NetilionObject):
         return f"Asset {self.asset_id} (serial number {self.serial_number or 'n/a'})"
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
             return self.asset_id == other.asset_id
         elif isinstance(other, dict):
             return self.asset_id == other.get("id")
@@ -154,31 +236,41 @@ class Asset(NetilionObject):
 
 
 class Unit(NetilionObject):
-    unit_id: Optional[int] = None
-    code: Optional[str] = None
-    name: Optional[str] = None
-
-    __allowed_units = {"degree_celsius", "metre_per_second", "gram_per_cubic_centimetre", "percent_mass",
-                       "percent_volume", "degree_plato", "percent", "millimetre", "millipascal_second",
-                       "percent_volume_per_hour", "fermentation_speed", "cubic_metre_per_second"}
+    __slots__ = ("unit_id", "code", "name")
+    unit_id: Optional[int]
+    code: Optional[str]
+    name: Optional[str]
 
     def __init__(self, unit_id: Optional[int] = None, code: Optional[str] = None, name: Optional[str] = None):
         if not unit_id and not code:
             raise MalformedNetilionApiResponse(msg="Requires either either ID or code to construct unit")
         self.unit_id = unit_id
-        self.code = code
+        # codes repeat a lot (every value carries its unit), interned they compare by identity
+        self.code = sys.intern(code) if isinstance(code, str) else code
         self.name = name
 
     @classmethod
     def unit_by_code(cls, code: str) -> Optional[Unit]:
-        if code in cls.__allowed_units:
-            return cls(code=code)
+        if code in _ALLOWED_UNITS:
+            return cls._by_code(code)
         else:
             return None
 
+    # units are treated as immutable, so the same unit can be shared by everything referring to it; this saves
+    # constructing the same handful of units over and over again when deserializing lots of values
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _by_code(cls, code: str) -> Unit:
+        return cls(code=code)
+
     @classmethod
     def deserialize(cls, body) -> T:
-        return cls(body.get("id", None), body.get("code", None), body.get("name", None))
+        return cls._deserialize_cached(body.get("id", None), body.get("code", None), body.get("name", None))
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _deserialize_cached(cls, unit_id: Optional[int], code: Optional[str], name: Optional[str]) -> Unit:
+        return cls(unit_id, code, name)
 
     def serialize(self) -> dict:
         # prefer human-readable codes over arbitrary ids.
@@ -188,38 +280,48 @@ class Unit(NetilionObject):
             return {"id": self.unit_id}
 
     def __str__(self):  # pragma: no cover
-        return f"Unit {self.unit_id or 'id n/a'}, {self.code or 'code n/a'} ({self.name or 'name n/a'})"
+        return f"Unit {'id n/a' if self.unit_id is None else self.unit_id}, {self.code or 'code n/a'} ({self.name or 'name n/a'})"
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.unit_id == other.unit_id and self.code == other.code
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
+            return (self.unit_id, self.code) == (other.unit_id, other.code)
         elif isinstance(other, dict):
-            return self.unit_id == other.get("id") and self.code == other.get("code")
+            return (self.unit_id, self.code) == (other.get("id"), other.get("code"))
         else:
             return False
 
 
 class AssetValue(NetilionObject):
-    key: str = None
-    unit: Unit = None
-    value: any = None
-    timestamp: Optional[datetime] = None
+    __slots__ = ("key", "unit", "value", "timestamp")
+    key: str
+    unit: Unit
+    value: any
+    timestamp: Optional[datetime]
 
     def __init__(self, key: str, unit: Union[Unit, dict], value: Union[int, float], timestamp: Optional[datetime] = None):
         self.key = key
         self.value = value
         self.timestamp: Optional[datetime] = timestamp
-        if isinstance(unit, Unit):
+        # identity check first, it's the common case and cheaper than isinstance; anything else must be a unit dict
+        if unit.__class__ is Unit or isinstance(unit, Unit):
             self.unit = unit
         else:
-            assert isinstance(unit, dict)
             self.unit = Unit.deserialize(unit)
 
+    @classmethod
+    def _with_unit(cls, key: str, unit: Unit, value: Union[int, float], timestamp: Optional[datetime]) -> AssetValue:
+        # __init__ without the unit check, for callers which already hold a Unit (e.g. one per key of a large payload)
+        asset_value = cls.__new__(cls)
+        asset_value.key = key
+        asset_value.unit = unit
+        asset_value.value = value
+        asset_value.timestamp = timestamp
+        return asset_value
+
     @classmethod
     def deserialize(cls, body) -> T:
-        ts = None
-        if "timestamp" in body:
-            ts = cls.deserialize_timestamp(body.get("timestamp"))
+        ts = body.get("timestamp")
+        ts = cls.deserialize_timestamp(ts) if ts else None
         return cls(body["key"], body["unit"], body["value"], timestamp=ts)
 
     @classmethod
@@ -227,41 +329,34 @@ class AssetValue(NetilionObject):
         if not timestamp:
             return None
         try:
-            if "." in timestamp:
-                day_time_format = "%Y-%m-%dT%H:%M:%S.%f%z"
-            else:
-                day_time_format = "%Y-%m-%dT%H:%M:%S%z"
-            return datetime.strptime(timestamp, day_time_format)
+            return _parse_timestamp(timestamp)
         except ValueError as val_err:  # pragma: no cover
-            cls.logger.error(f"Unknown datetime format: {timestamp}: {val_err}")
+            logger.error("Unknown datetime format: %s: %s", timestamp, val_err)
             return None
 
     def serialize(self) -> dict:
         j = {"key": self.key, "unit": self.unit.serialize(), "value": self.value}
         if self.timestamp:
-            utc_ts = self.timestamp.astimezone(timezone.utc)
-            # python's strftime/strptime use microseconds, Netilion milliseconds
-            time_to_seconds = utc_ts.strftime("%Y-%m-%dT%H:%M:%S")
-            milliseconds = int(utc_ts.strftime("%f")) // 1000
-            # since we convert to UTC first, we can hardcode the TZ code -- Z == "UTC"
-            j["timestamp"] = f"{time_to_seconds}.{milliseconds:03}Z"
+            j["timestamp"] = _serialize_timestamp(self.timestamp)
         return j
 
     def __str__(self):  # pragma: no cover
         return f"AssetValue {self.key}: {self.value} ({self.unit}, {self.timestamp or 'timestamp n/a'})"
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.key == other.key and self.unit == other.unit and self.value == other.value and self.unit == other.unit
+        # the timestamp is deliberately not compared: values are matched against payloads which may not carry one
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
+            return (self.key, self.value, self.unit) == (other.key, other.value, other.unit)
         elif isinstance(other, dict):
-            return self.key == other.get("key") and self.unit == other.get("unit") and self.value == other.get("value") and self.unit == other.get("unit")
+            return (self.key, self.value, self.unit) == (other.get("key"), other.get("value"), other.get("unit"))
         else:
             return False
 
 
 class AssetValues(NetilionObject):
-    asset: Asset = None
-    values: list[AssetValue] = None
+    __slots__ = ("asset", "values")
+    asset: Asset
+    values: list[AssetValue]
 
     def __init__(self, asset, values: list[AssetValue]):
         self.asset = asset
@@ -272,32 +367,34 @@ class AssetValues(NetilionObject):
         content = body["content"]
         asset = Asset(content["asset"]["id"], content["asset"].get("serial_number"))
         asset_values: list[AssetValue] = []
+        new_value = AssetValue._with_unit  # pylint: disable=protected-access
         for value in content["values"]:
             value_key = value["key"]
             value_datas = value["data"]
-            value_unit = value["unit"]
+            # all data points of a key share its unit, so construct that only once
+            value_unit = Unit.deserialize(value["unit"])
             for value_data in value_datas:
-                if "timestamp" in value_data:
-                    timestamp = AssetValue.deserialize_timestamp(value_data.get("timestamp"))
-                else:
-                    timestamp = None
-                asset_values.append(AssetValue(value_key, value_unit, value_data["value"], timestamp=timestamp))
+                # a single lookup; deserialize_timestamp is only needed if there actually is a timestamp
+                timestamp = value_data.get("timestamp")
+                timestamp = AssetValue.deserialize_timestamp(timestamp) if timestamp else None
+                asset_values.append(new_value(value_key, value_unit, value_data["value"], timestamp))
 
         return cls(asset, values=asset_values)
 
     def serialize(self) -> dict:
-        keys = {asset_value.key for asset_value in self.values}
+        # group the values by key in a single pass
+        values_by_key: dict[str, list[AssetValue]] = {}
+        for asset_value in self.values:
+            values_by_key.setdefault(asset_value.key, []).append(asset_value)
         values = []
-        # Note: this is sorted() because that makes the key order deterministic for unit-testing purposes.
-        for key in sorted(keys):
-            # there should now always be at least one AssetValue for this key since that's where we got the key from
-            asset_values = [asset_value for asset_value in self.values if asset_value.key == key]
+        # keys are in order of their first appearance, which is just as deterministic as sorting them
+        for key, asset_values in values_by_key.items():
             key_unit = asset_values[0].unit
             key_value_data = []
             for asset_value in asset_values:
                 d = {"value": asset_value.value}
                 if asset_value.timestamp:
-                    d["timestamp"] = asset_value.serialize().get("timestamp")
+                    d["timestamp"] = _serialize_timestamp(asset_value.timestamp)
                 key_value_data.append(d)
             key_values = {
                 "key": key,
@@ -312,15 +409,16 @@ class AssetValues(NetilionObject):
 
     def __eq__(self, other):
         # we assume for the moment that value order matters
-        if isinstance(other, AssetValues):
-            return self.asset == other.asset and self.values == other.values
+        if other.__class__ is AssetValues or isinstance(other, AssetValues):
+            return (self.asset, self.values) == (other.asset, other.values)
         else:
             return False
 
 
 class AssetValuesByKey(NetilionObject):
-    value: any = None
-    timestamp: datetime = None
+    __slots__ = ("value", "timestamp")
+    value: any
+    timestamp: datetime
 
     def __init__(self, value: Union[int, float], timestamp: datetime = None):
         self.value = value
@@ -333,33 +431,22 @@ class AssetValuesByKey(NetilionObject):
 
     @classmethod
     def deserialize_timestamp(cls, timestamp: str) -> datetime:
-        if "." in timestamp:
-            day_time_format = "%Y-%m-%dT%H:%M:%S.%f%z"
-        else:
-            day_time_format = "%Y-%m-%dT%H:%M:%S%z"
-        return datetime.strptime(timestamp, day_time_format)
+        return _parse_timestamp(timestamp)
 
     def serialize(self) -> dict:
-        j = {"value": self.value}
-        utc_ts = self.timestamp.astimezone(timezone.utc)
-        # python's strftime/strptime use microseconds, Netilion milliseconds
-        time_to_seconds = utc_ts.strftime("%Y-%m-%dT%H:%M:%S")
-        milliseconds = int(utc_ts.strftime("%f")) // 1000
-        # since we convert to UTC first, we can hardcode the TZ code -- Z == "UTC"
-        j["timestamp"] = f"{time_to_seconds}.{milliseconds:03}Z"
-        return j
+        return {"value": self.value, "timestamp": _serialize_timestamp(self.timestamp)}
 
     def __str__(self):  # pragma: no cover
         return f"AssetValue {self.value}, {self.timestamp or 'timestamp n/a'})"
 
 
 class AssetSystem(NetilionObject):
-    system_id = None
-    specifications: dict = {}
+    __slots__ = ("system_id", "specifications")
+    specifications: dict
 
     def __init__(self, system_id, specifications=None):
         self.system_id = system_id
-        self.specifications = specifications or {}
+        self.specifications = specifications or _NO_SPECIFICATIONS
 
     @classmethod
     def deserialize(cls, body) -> T:
@@ -369,16 +456,15 @@ class AssetSystem(NetilionObject):
         return {"id": self.system_id}
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
             return self.system_id == other.system_id
         else:
             return False
 
 
 class AssetHealthCondition(NetilionObject):
-
-    health_condition_id = None
-    diagnosis_code: str = None
+    __slots__ = ("health_condition_id", "diagnosis_code")
+    diagnosis_code: str
 
     def __init__(self, health_condition_id, diagnosis_code: str):
         self.health_condition_id = health_condition_id
@@ -392,17 +478,14 @@ class AssetHealthCondition(NetilionObject):
         return {"id": self.health_condition_id, "diagnosis_code": self.diagnosis_code}
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.health_condition_id == other.health_condition_id and self.diagnosis_code == other.diagnosis_code
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
+            return (self.health_condition_id, self.diagnosis_code) == (other.health_condition_id, other.diagnosis_code)
         else:
             return False
 
 
 class Node(NetilionObject):
-    node_id = None
-    name = None
-    description = None
-    hidden = False
+    __slots__ = ("node_id", "name", "description", "hidden")
 
     def __init__(self, node_id: int, name: str = "", description: str = "", hidden: bool = False):
         self.node_id = node_id
@@ -419,22 +502,20 @@ class Node(NetilionObject):
         return body
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
             return self.node_id == other.node_id
         else:
             return False
 
 
 class NodeSpecification(NetilionObject):
-    node_id = None
-    name = None
-    specifications: dict = {}
-    hidden = False
+    __slots__ = ("node_id", "name", "specifications", "hidden")
+    specifications: dict
 
     def __init__(self, node_id: int, name: str = "", specifications: Optional[dict] = None, hidden: bool = False):
         self.node_id = node_id
         self.name = name
-        self.specifications = specifications or {}
+        self.specifications = specifications or _NO_SPECIFICATIONS
         self.hidden = hidden
 
     @classmethod
@@ -448,13 +529,14 @@ class NodeSpecification(NetilionObject):
         return body
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(other, self.__class__):
             return self.node_id == other.node_id
         else:
             return False
 
 
 class Specification(NetilionObject):
+    __slots__ = ("key", "value", "unit", "ui_visible")
     key: str
     value: str
     unit: Optional[Unit]
@@ -492,10 +574,11 @@ class Specification(NetilionObject):
 
 
 class Pagination(NetilionObject):
-    page_count: int = None
-    per_page: int = None
-    page: int = None
-    next_url: Optional[str] = None
+    __slots__ = ("page_count", "per_page", "page", "next_url")
+    page_count: int
+    per_page: int
+    page: int
+    next_url: Optional[str]
 
     def __init__(self, page_count: int, per_page: int, page: int, next_url: Optional[str] = None):
         self.page_count = page_count
@@ -506,7 +589,7 @@ class Pagination(NetilionObject):
     @classmethod
     def deserialize(cls, body) -> T:
         pagination = body["pagination"]
-        return cls(pagination["page_count"], pagination["per_page"], pagination["page"], pagination.get("next", None))
+        return cls(*_pagination_keys(pagination), pagination.get("next", None))
 
     def serialize(self) -> dict:
         pagination = {"page_count": self.page_count, "per_page": self.per_page, "page": self.page}
@@ -515,22 +598,23 @@ class Pagination(NetilionObject):
         return pagination
 
 
-class DocumentClassification(Enum):
+class DocumentClassification(IntEnum):
     UNDEFINED = 1
     PUBLIC = 2
     INTERNAL = 3
     CONFIDENTIAL = 4
 
 
-class DocumentStatus(Enum):
+class DocumentStatus(IntEnum):
     UNDEFINED = 1
 
 
 class Document(NetilionObject):
-    document_id: int = None
-    name: str = None
-    classification: DocumentClassification = None
-    status: DocumentStatus = None
+    __slots__ = ("document_id", "name", "classification", "status", "attachments")
+    document_id: int
+    name: str
+    classification: DocumentClassification
+    status: DocumentStatus
     attachments: list[Attachment]
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -549,12 +633,13 @@ class Document(NetilionObject):
     def deserialize(cls, body) -> T:
         document_id = int(body["id"])
         name = body["name"]
-        classification = DocumentClassification(body["classification"]["id"])
-        status = DocumentStatus(body["status"]["id"])
-        if body.get("attachments") is not None:
-            attachments = Attachment.parse_multiple_from_api(body, "attachments")
-        else:
-            attachments = []
+        # plain dict lookups instead of Enum.__call__; unknown ids raise a KeyError, i.e. a malformed response
+        classification = DocumentClassification._value2member_map_[body["classification"]["id"]]  # pylint: disable=protected-access
+        status = DocumentStatus._value2member_map_[body["status"]["id"]]  # pylint: disable=protected-access
+        # the document body has already been checked for errors, no need to do that again for its attachments
+        attachments_body = body.get("attachments")
+        attachments = [Attachment._deserialize_unchecked(attachment)  # pylint: disable=protected-access
+                       for attachment in attachments_body] if attachments_body else []
 
         return cls(document_id, name, classification, status, attachments)
 
@@ -570,9 +655,10 @@ class Document(NetilionObject):
 
 
 class Attachment(NetilionObject):
-    attachment_id: int = None
-    file_name: str = None
-    content_type: str = None
+    __slots__ = ("attachment_id", "file_name", "content_type")
+    attachment_id: int
+    file_name: str
+    content_type: str
 
     def __init__(self, attachment_id: int, file_name: str, content_type: str):
         self.attachment_id = attachment_id
@@ -581,10 +667,8 @@ class Attachment(NetilionObject):
 
     @classmethod
     def deserialize(cls, body) -> T:
-        attachment_id = int(body["id"])
-        file_name = body["file_name"]
-        content_type = body["content_type"]
-        return cls(attachment_id, file_name, content_type)
+        attachment_id, file_name, content_type = _attachment_keys(body)
+        return cls(int(attachment_id), file_name, content_type)
 
     def serialize(self) -> dict:
         attachment = {
@@ -0,0 +1,54 @@
+# pylint: skip-file
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from netilion.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_caches_value(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        loader = MagicMock(return_value="value")
+        assert cache.get("key", loader) == "value"
+        assert cache.get("key", loader) == "value"
+        assert loader.call_count == 1
+        assert len(cache) == 1
+
+    def test_does_not_cache_none(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        loader = MagicMock(return_value=None)
+        assert cache.get("key", loader) is None
+        assert cache.get("key", loader) is None
+        assert loader.call_count == 2
+        assert len(cache) == 0
+
+    def test_does_not_cache_errors(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        loader = MagicMock(side_effect=[ValueError("boom"), "value"])
+        with pytest.raises(ValueError):
+            cache.get("key", loader)
+        assert cache.get("key", loader) == "value"
+
+    def test_expires_entries(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        with patch("netilion.cache.time.monotonic", side_effect=[0, 30, 61, 62]):
+            assert cache.get("key", lambda: "old") == "old"
+            assert cache.get("key", lambda: "unused") == "old"
+            assert cache.get("key", lambda: "new") == "new"
+            assert cache.get("key", lambda: "unused") == "new"
+
+    def test_evicts_oldest_entry(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        for key in ("a", "b", "c"):
+            cache.get(key, lambda key=key: key.upper())
+        assert len(cache) == 2
+        assert cache.get("a", lambda: "reloaded") == "reloaded"
+        assert cache.get("c", lambda: "unused") == "C"
+
+    def test_clear(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.get("key", lambda: "value")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get("key", lambda: "new") == "new"
@@ -1,21 +1,172 @@
 # pylint: skip-file
 import json
-import math
+import logging
+import threading
 import time
 import urllib.parse
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 import responses
+from oauthlib.oauth2.rfc6749.errors import InvalidGrantError, MissingTokenError
+from urllib3.util.retry import Retry
 
+from netilion import codec
 from netilion.client import NetilionTechnicalApiClient
 from netilion.config import ConfigurationParameters
 from netilion.error import MalformedNetilionApiResponse, BadNetilionApiPermission, GenericNetilionApiError, \
-    QuotaExceeded, MalformedNetilionApiRequest, InvalidNetilionApiState
+    QuotaExceeded, MalformedNetilionApiRequest, InvalidNetilionApiState, PartialNetilionApiFailure
 from netilion.model import ClientApplication, WebHook, Asset, AssetValue, AssetValues, AssetValuesByKey, Unit, \
     DocumentClassification, DocumentStatus, Specification
 
 
+# token request bodies the client is expected to send, see _capture_oauth_token
+_PASSWORD_GRANT_PARAMS = {
+    "client_id": "id",
+    "client_secret": "secret",
+    "username": "user",
+    "password": "pass",
+    "grant_type": "password"
+}
+_REFRESH_GRANT_PARAMS = {
+    "grant_type": "refresh_token",
+    "refresh_token": "reftok",
+    "client_id": "id",
+    "client_secret": "secret"
+}
+_GRANT_PARAMS = {"password": _PASSWORD_GRANT_PARAMS, "refresh_token": _REFRESH_GRANT_PARAMS}
+
+# a page of alcohol values, as answered for value history requests
+_ALCOHOL_HISTORY_BODY = {
+    "key": "alcohol_balling",
+    "unit": {
+        "id": 8612,
+        "href": "https://api.staging-env.netilion.endress.com/v1/units/8612"
+    },
+    "latest": -0.17572078817507417,
+    "min": -3.1412830460507917,
+    "max": 43.639857800823826,
+    "mean": 11.63084701425248,
+    "data": [
+        {
+            "timestamp": "2022-01-19T14:00:15.202Z",
+            "value": 43.639857800823826
+        },
+        {
+            "timestamp": "2022-01-19T14:21:17.211Z",
+            "value": -3.1412830460507917
+        },
+        {
+            "timestamp": "2022-01-19T14:22:17.24Z",
+            "value": 28.460037110165224
+        },
+        {
+            "timestamp": "2022-01-19T14:38:43.294Z",
+            "value": 6.331548934579579
+        },
+        {
+            "timestamp": "2022-01-19T14:40:29.1Z",
+            "value": 7.179125310495604
+        },
+    ],
+    "pagination": {
+        "page_count": 4,
+        "per_page": 500,
+        "page": 1
+    }
+}
+
+# lookups by serial number / code, the query strings are the same on every run
+_FIND_ASSET_URL_DEADBEEF = f"https://host.local/v1//assets?{urllib.parse.urlencode({'serial_number': '0xdeadbeef'})}"
+_FIND_ASSET_URL_RESTAURANT = \
+    f"https://host.local/v1//assets?{urllib.parse.urlencode({'serial_number': 'the restaurant at the end of the universe'})}"
+_FIND_UNIT_URL_ABSORBANCE = f"https://host.local/v1//units?{urllib.parse.urlencode({'code': 'absorbance_unit'})}"
+_FIND_UNIT_URL_ELBOWS = f"https://host.local/v1//units?{urllib.parse.urlencode({'code': 'elbows'})}"
+
+# the webhook the set_webhook tests register; the client only reads it
+_NEW_WEBHOOK = WebHook("http://host2.local", ["asset_values_created"])
+
+# outcomes of requests which succeed (with or without content) or are rejected as bad requests
+_SUCCESS_OR_BAD_REQUEST = [pytest.param(204, None, id="success"),
+                           pytest.param(400, MalformedNetilionApiRequest, id="failure")]
+_OK_OR_BAD_REQUEST = [pytest.param(200, None, id="success"),
+                      pytest.param(400, MalformedNetilionApiRequest, id="failure")]
+
+# request bodies several tests expect the client to send; matchers are stateless, so they can be shared
+_HEALTH_CONDITIONS_MATCHER = responses.json_params_matcher({
+    "health_conditions": [
+        {"id": 9999},
+        {"id": 100}
+    ]
+})
+_RW_PERMISSIONS_MATCHER = responses.json_params_matcher({
+    "permission_type": ["can_read", "can_update"],
+    "assignable": {"id": 666, "type": "User"},
+    "permitable": {"id": 47, "type": "Asset"}
+})
+_POST_DOCUMENT_MATCHER = responses.json_params_matcher({
+    "name": "test_document",
+    "classification": {
+        "id": 1
+    },
+    "status": {
+        "id": 1
+    }
+})
+
+
+class _SignallingLock:
+    # wraps a lock and signals once a thread is about to acquire it
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entering = threading.Event()
+
+    def __enter__(self):
+        self.entering.set()
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        return self.lock.__exit__(*args)
+
+
+class _StubNetilionServer(ThreadingHTTPServer):
+    # a local stand-in for Netilion; unlike `responses`, requests to it pass through the mounted HTTPAdapter
+    def __init__(self, statuses: list[int]):
+        self.statuses = statuses
+        self.received = []
+        super().__init__(("127.0.0.1", 0), _StubNetilionHandler)
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubNetilionHandler(BaseHTTPRequestHandler):
+    def _respond(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._respond(200, {"access_token": "acctok", "refresh_token": "reftok", "created_at": int(time.time()),
+                            "expires_in": 1000, "token_type": "Bearer"})
+
+    def do_GET(self):
+        self.server.received.append(self.path)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self._respond(status, {"nodes": []})
+
+    def log_message(self, *args):
+        pass
+
+
 class TestMockedNetilionApiClient:
 
     @staticmethod
@@ -24,7 +175,7 @@ class TestMockedNetilionApiClient:
         if not data_key:
             data_key = next(iter(data))
         total_count = len(data[data_key])
-        page_count = max(math.floor((float(total_count) + per_page - 1) // per_page), 1)
+        page_count = max(1, -(-total_count // per_page))
         return {
             **data,
             "pagination": {
@@ -56,57 +207,43 @@ class TestMockedNetilionApiClient:
         self._capture_oauth_token(configuration)
 
     @pytest.fixture()
-    def client_application_response(self, configuration, api_client, capture_oauth_token):
+    def client_application_response(self, api_client, capture_oauth_token, client_applications_body):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATIONS)
-        responses.add(responses.GET, url, json=self._add_pagination_info({
+        responses.add(responses.GET, url, json=client_applications_body)
+
+    @pytest.fixture(scope="session")
+    def client_applications_body(self):
+        # static, so built once; responses encodes it anew on every add, nothing gets to modify it
+        return self._add_pagination_info({
             "client_applications": [
                 {
-                    "name": configuration.client_application_name,
+                    "name": "app1",
                     "id": 1,
                     "contact_person": {
                         "id": 1,
                         "href": ""
                     }
                 }]
-        }))
+        })
 
     def _capture_oauth_token(self, configuration,
-                             access_tok_created_at=int(time.time()),
-                             access_tok_expires_in=1000):
+                             access_tok_created_at: int = None,
+                             access_tok_expires_in=1000,
+                             grant_types=("password",)):
         # Note: if the client attempts a request not exactly matching the one below, responses will throw an error.
-        responses.add(responses.POST,
-                      configuration.oauth_token_url,
-                      body=json.dumps({
-                          "access_token": "acctok",
-                          "refresh_token": "reftok",
-                          "created_at": access_tok_created_at,
-                          "expires_in": access_tok_expires_in}),
-                      match=[
-                          # convert the following params to a string-encoded request body
-                          responses.urlencoded_params_matcher({
-                              "client_id": "id",
-                              "client_secret": "secret",
-                              "username": "user",
-                              "password": "pass",
-                              "grant_type": "password"
-                          })
-                      ])
-        responses.add(responses.POST,
-                      configuration.oauth_token_url,
-                      body=json.dumps({
-                          "access_token": "acctok",
-                          "refresh_token": "reftok",
-                          "created_at": access_tok_created_at,
-                          "expires_in": access_tok_expires_in}),
-                      match=[
-                          # convert the following params to a string-encoded request body
-                          responses.urlencoded_params_matcher({
-                              "grant_type": "refresh_token",
-                              "refresh_token": "reftok",
-                              "client_id": "id",
-                              "client_secret": "secret"
-                          })
-                      ])
+        # only tests which let the token expire need the refresh grant
+        if access_tok_created_at is None:
+            access_tok_created_at = int(time.time())
+        # all grants answer with the same token
+        token = {
+            "access_token": "acctok",
+            "refresh_token": "reftok",
+            "created_at": access_tok_created_at,
+            "expires_in": access_tok_expires_in}
+        for grant_params in map(_GRANT_PARAMS.get, grant_types):
+            # convert the grant params to a string-encoded request body
+            responses.add(responses.POST, configuration.oauth_token_url, json=token,
+                          match=[responses.urlencoded_params_matcher(grant_params)])
 
     def test_self_pagination_with_key(self):
         original_data = {"something": ["x", "y", "z"], "something_else": [1, 2]}
@@ -135,6 +272,74 @@ class TestMockedNetilionApiClient:
             }
         }
 
+    def test_construct_url(self, api_client):
+        assert api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS) == "https://host.local/v1//assets"
+        assert api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": 7}) == "https://host.local/v1//assets/7"
+        assert api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET) == "https://host.local/v1//assets/{asset_id}"
+        assert api_client.construct_url("/nodes/{node_id}/assets", {"node_id": 3}) == "https://host.local/v1//nodes/3/assets"
+
+    def test_static_urls(self, api_client):
+        assert api_client._static_urls[NetilionTechnicalApiClient.ENDPOINT.ASSETS] == "https://host.local/v1//assets"
+        assert NetilionTechnicalApiClient.ENDPOINT.ASSET not in api_client._static_urls
+        for endpoint, url in api_client._static_urls.items():
+            assert api_client.construct_url(endpoint) == url
+
+    @responses.activate
+    def test_request_timing_logging_disabled(self, configuration, api_client, capture_oauth_token):
+        target_url = f"{configuration.endpoint}/"
+        responses.add(responses.GET, target_url, status=200)
+        responses.add(responses.POST, target_url, status=200)
+        api_client.request_timing_logger.setLevel(logging.INFO)
+        try:
+            with patch('netilion.client.time.monotonic') as monotonic_mock:
+                api_client.get(target_url)
+                api_client.post(target_url)
+                monotonic_mock.assert_not_called()
+        finally:
+            api_client.request_timing_logger.setLevel(logging.NOTSET)
+        assert len(responses.calls) == 3
+
+    @pytest.fixture()
+    def stub_server(self, monkeypatch):
+        # the stub only speaks plain HTTP
+        monkeypatch.setenv("OAUTHLIB_INSECURE_TRANSPORT", "1")
+        # the retries are what's tested, not the time waited in between
+        monkeypatch.setattr(Retry, "get_backoff_time", lambda retry: 0)
+        servers = []
+
+        def start(statuses: list[int]) -> _StubNetilionServer:
+            server = _StubNetilionServer(statuses)
+            # a short poll interval, shutdown() otherwise waits up to half a second per server
+            threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+            servers.append(server)
+            return server
+
+        yield start
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_retries_transient_gateway_errors(self, stub_server):
+        server = stub_server([503, 502])
+        api_client = NetilionTechnicalApiClient(ConfigurationParameters(server.endpoint, "id", "secret", "user", "pass"))
+        assert api_client.get_nodes() == []
+        assert len(server.received) == 3
+
+    def test_returns_last_response_when_retries_are_exhausted(self, stub_server):
+        server = stub_server([503] * 4)
+        api_client = NetilionTechnicalApiClient(ConfigurationParameters(server.endpoint, "id", "secret", "user", "pass"))
+        with pytest.raises(MalformedNetilionApiRequest):
+            api_client.get_nodes()
+        # the initial request plus three retries, then the last 503 is handed to the status checks
+        assert len(server.received) == 4
+
+    def test_mounts_pooled_adapter(self, configuration, api_client):
+        for prefix in ("https://", "http://"):
+            adapter = api_client.get_adapter(f"{prefix}host.local")
+            assert adapter._pool_connections == configuration.pool_connections
+            assert adapter._pool_maxsize == configuration.pool_maxsize
+            assert adapter.max_retries.total == 3
+
     @responses.activate
     def test_adds_oauth_body(self, configuration, api_client, capture_oauth_token):
         url = configuration.endpoint
@@ -145,6 +350,38 @@ class TestMockedNetilionApiClient:
         assert responses.calls[0].request.url == configuration.oauth_token_url, "Missing call to API to obtain OAuth token"
         assert api_client.authorized, "No access token obtained"
 
+    @responses.activate
+    def test_fetch_token_without_created_at(self, configuration, api_client):
+        responses.add(responses.POST, configuration.oauth_token_url, json={"access_token": "acctok", "expires_in": 1000})
+        before = time.time()
+        token = api_client.fetch_token()
+        assert before <= token["created_at"] <= time.time()
+        assert api_client.authorized
+        assert not api_client._token_expired()
+        assert responses.calls[0].request.headers["Accept"] == "application/json"
+
+    @responses.activate
+    def test_fetch_token_error(self, configuration, api_client):
+        responses.add(responses.POST, configuration.oauth_token_url, status=400,
+                      json={"error": "invalid_grant", "error_description": "bad credentials"})
+        with pytest.raises(InvalidGrantError):
+            api_client.fetch_token()
+        assert not api_client.authorized
+
+    @responses.activate
+    def test_fetch_token_missing_access_token(self, configuration, api_client):
+        responses.add(responses.POST, configuration.oauth_token_url, json={"token_type": "Bearer"})
+        with pytest.raises(MissingTokenError):
+            api_client.fetch_token()
+        assert not api_client.authorized
+
+    @responses.activate
+    def test_sends_api_key(self, configuration, api_client, capture_oauth_token):
+        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
+        responses.add(responses.GET, url, json=self._add_pagination_info({"assets": []}))
+        api_client.get_assets()
+        assert responses.calls[-1].request.headers["Api-Key"] == configuration.client_id
+
     @responses.activate
     def test_rejects_non_netilion_url(self, api_client):
         url = "https://www.google.com"
@@ -153,11 +390,11 @@ class TestMockedNetilionApiClient:
             api_client.get(url)
 
     @responses.activate
-    def test_refreshes_expired_token(self, configuration, api_client):
+    def test_refreshes_expired_token(self, configuration, api_client, monkeypatch):
         expiry = 1000
         now = int(time.time())
         access_token_expired_ts = expiry + now + 1
-        self._capture_oauth_token(configuration, now, expiry)
+        self._capture_oauth_token(configuration, now, expiry, grant_types=("password", "refresh_token"))
 
         target_url = configuration.endpoint
         if not target_url.endswith("/"):  # pragma: no cover -- this is basically a configuration artifact from base.py
@@ -170,32 +407,92 @@ class TestMockedNetilionApiClient:
         assert responses.calls[0].request.url == configuration.oauth_token_url
         assert responses.calls[1].request.url == target_url
 
-        # expire the token by forwarding the clock
-        with patch('netilion.client.time') as time_mock:
-            time_mock.time = MagicMock(return_value=access_token_expired_ts)
-            api_client.get(target_url)
-            assert responses.calls[2].request.url == configuration.oauth_token_url, "Should have requested new token"
-            assert responses.calls[3].request.url == target_url
+        # expire the token by forwarding the clock; only the wall clock is forwarded, request timing still needs a
+        # working monotonic clock
+        monkeypatch.setattr("netilion.client.time", SimpleNamespace(time=lambda: access_token_expired_ts,
+                                                                    monotonic=time.monotonic))
+        api_client.get(target_url)
+        assert responses.calls[2].request.url == configuration.oauth_token_url, "Should have requested new token"
+        assert responses.calls[3].request.url == target_url
 
-            # return the time to reality
-            time_mock.time = MagicMock(return_value=time.time())
-            # check this to make sure we don't immediately ask again for a new token
-            api_client.get(target_url)
-            assert responses.calls[4].request.url == target_url
+        # return the time to reality
+        monkeypatch.undo()
+        # check this to make sure we don't immediately ask again for a new token
+        api_client.get(target_url)
+        assert responses.calls[4].request.url == target_url
 
     @responses.activate
-    def test_get_applications(self, configuration, api_client, capture_oauth_token):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATIONS)
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "client_applications": [{
-                "name": "app1",
-                "id": 1,
-                "contact_person": {
-                    "id": 1,
-                    "href": ""
-                }
-            }]
-        }))
+    def test_refreshes_token_before_expiry(self, configuration, api_client):
+        # the token is still valid for a few seconds, but within the refresh skew
+        self._capture_oauth_token(configuration, int(time.time()) - 990, 1000, grant_types=("password", "refresh_token"))
+        target_url = f"{configuration.endpoint}/"
+        responses.add(responses.GET, target_url, status=200)
+
+        api_client.get(target_url)
+        api_client.get(target_url)
+        assert [call.request.url for call in responses.calls] == [
+            configuration.oauth_token_url, target_url, configuration.oauth_token_url, target_url
+        ]
+
+    @responses.activate
+    def test_concurrent_requests_fetch_token_once(self, configuration, api_client, capture_oauth_token):
+        target_url = f"{configuration.endpoint}/"
+        responses.add(responses.GET, target_url, status=200)
+
+        api_client.map_concurrently(api_client.get, [target_url] * 10)
+        token_calls = [call for call in responses.calls if call.request.url == configuration.oauth_token_url]
+        assert len(token_calls) == 1
+        assert len(responses.calls) == 11
+
+    @responses.activate
+    def test_waiting_thread_reuses_token_obtained_meanwhile(self, configuration, api_client, capture_oauth_token):
+        token_lock = _SignallingLock()
+        api_client._NetilionTechnicalApiClient__token_lock = token_lock
+        with token_lock.lock:
+            waiting = threading.Thread(target=api_client._ensure_token)
+            waiting.start()
+            # the other thread has passed the lock-free check and is blocked on the lock now
+            assert token_lock.entering.wait(5)
+            api_client.fetch_token()
+        waiting.join()
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_assigned_token_is_not_refreshed(self, configuration, api_client):
+        target_url = f"{configuration.endpoint}/"
+        responses.add(responses.GET, target_url, status=200)
+        api_client.token = {"access_token": "acctok", "refresh_token": "reftok", "token_type": "Bearer",
+                            "created_at": int(time.time()), "expires_in": 1000}
+
+        api_client.get(target_url)
+        assert [call.request.url for call in responses.calls] == [target_url]
+
+    @responses.activate
+    def test_assigned_token_without_created_at(self, configuration):
+        target_url = f"{configuration.endpoint}/"
+        responses.add(responses.GET, target_url, status=200)
+        api_client = NetilionTechnicalApiClient(configuration)
+        api_client.token = {"access_token": "acctok", "token_type": "Bearer", "expires_in": 1000}
+        api_client.get(target_url)
+        api_client.token = {"access_token": "acctok", "token_type": "Bearer", "expires_at": time.time() + 1000}
+        api_client.get(target_url)
+        assert [call.request.url for call in responses.calls] == [target_url, target_url]
+
+    def test_cleared_token_expires(self, api_client):
+        api_client.token = {"access_token": "acctok", "token_type": "Bearer", "created_at": int(time.time()), "expires_in": 1000}
+        assert not api_client._token_expired()
+        api_client.token = {}
+        assert api_client._token_expired()
+
+    def test_valid_token_skips_lock(self, api_client):
+        api_client.token = {"access_token": "acctok", "token_type": "Bearer", "created_at": int(time.time()), "expires_in": 1000}
+        token_lock = MagicMock()
+        api_client._NetilionTechnicalApiClient__token_lock = token_lock
+        api_client._ensure_token()
+        token_lock.__enter__.assert_not_called()
+
+    @responses.activate
+    def test_get_applications(self, configuration, api_client, client_application_response):
         apps = api_client.get_applications()
         assert isinstance(apps, list), "No client applications received"
         assert len(apps) == 1, "No client applications received"
@@ -221,7 +518,40 @@ class TestMockedNetilionApiClient:
         # a second call to my_application must return a cached value and not hit the API again
         api_client.get_my_application()
         assert len(responses.calls) == 2  # 1 token + 1 client_applications request
-        assert responses.calls[1].request.path_url.endswith(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION_CURRENT.value)
+        assert responses.calls[1].request.path_url.endswith(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION_CURRENT)
+
+    @responses.activate
+    def test_webhooks_resolve_application_once(self, configuration, api_client, capture_oauth_token):
+        configuration.client_application_id = None
+        responses.add(responses.GET, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION_CURRENT),
+                      json={"name": "app1", "id": 1})
+        responses.add(responses.GET, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.WEBHOOK, {"application_id": 1, "webhook_id": 1}),
+                      json={"id": 1, "url": "http://host.local", "event_types": ["asset_value_created"]})
+        api_client.fetch_token()
+
+        webhooks = api_client.map_concurrently(api_client.get_webhook, [1] * 5)
+        assert all(webhook.api_id == 1 for webhook in webhooks)
+        current_calls = [call for call in responses.calls
+                         if call.request.url.endswith(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION_CURRENT)]
+        assert len(current_calls) == 1
+
+    @responses.activate
+    def test_waiting_thread_reuses_application_determined_meanwhile(self, configuration, api_client, capture_oauth_token):
+        configuration.client_application_id = None
+        responses.add(responses.GET, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION_CURRENT),
+                      json={"name": "app1", "id": 1})
+        application_lock = _SignallingLock()
+        api_client._NetilionTechnicalApiClient__application_lock = application_lock
+        with application_lock.lock:
+            waiting = threading.Thread(target=api_client.get_my_application)
+            waiting.start()
+            # the other thread has passed the lock-free check and is blocked on the lock now
+            assert application_lock.entering.wait(5)
+            application_lock.entering.clear()
+            app = ClientApplication.parse_from_api({"name": "app1", "id": 1})
+            api_client._NetilionTechnicalApiClient__my_application = app
+        waiting.join()
+        assert len(responses.calls) == 0
 
     @responses.activate
     def test_get_my_application_no_request_if_id_env(self, configuration, api_client, capture_oauth_token):
@@ -271,6 +601,18 @@ class TestMockedNetilionApiClient:
         asset = api_client.get_asset(1)
         assert isinstance(asset, Asset)
 
+    @responses.activate
+    def test_get_assets_by_ids(self, configuration, api_client, capture_oauth_token, client_application_response):
+        for asset_id in (1, 2, 3):
+            url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": asset_id})
+            responses.add(responses.GET, url, json={"id": asset_id, "serial_number": f"sn{asset_id}"})
+        # make sure the token exists before fanning out
+        api_client.fetch_token()
+
+        assets = api_client.get_assets_by_ids([3, 1, 2])
+        assert [asset.asset_id for asset in assets] == [3, 1, 2]
+        assert [asset.serial_number for asset in assets] == ["sn3", "sn1", "sn2"]
+
     @responses.activate
     def test_create_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
@@ -291,19 +633,24 @@ class TestMockedNetilionApiClient:
     @responses.activate
     def test_delete_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": 1})
-        asset = Asset(1)
         responses.add(responses.DELETE, url, status=204)
-        api_client.delete_asset(asset.asset_id)
+        api_client.delete_asset(1)
         # 0 is token call
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "DELETE"
 
+    @pytest.mark.parametrize("status, error", [(200, InvalidNetilionApiState), (404, MalformedNetilionApiRequest),
+                                               (500, InvalidNetilionApiState)])
+    @responses.activate
+    def test_delete_asset_failure(self, configuration, api_client, capture_oauth_token, status, error):
+        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": 1})
+        responses.add(responses.DELETE, url, status=status)
+        with pytest.raises(error):
+            api_client.delete_asset(1)
+
     @responses.activate
     def test_find_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
-        params = urllib.parse.urlencode({"serial_number": "0xdeadbeef"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
+        responses.add(responses.GET, _FIND_ASSET_URL_DEADBEEF, json=self._add_pagination_info({
             "assets": [
                 {
                     "id": 1,
@@ -317,10 +664,7 @@ class TestMockedNetilionApiClient:
 
     @responses.activate
     def test_find_asset_inexistent(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
-        params = urllib.parse.urlencode({"serial_number": "the restaurant at the end of the universe"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
+        responses.add(responses.GET, _FIND_ASSET_URL_RESTAURANT, json=self._add_pagination_info({
             "assets": [],
         }))
         asset = api_client.find_asset("the restaurant at the end of the universe")
@@ -329,15 +673,9 @@ class TestMockedNetilionApiClient:
     @responses.activate
     def test_set_permissions(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.PERMISSIONS)
-        responses.add(responses.POST, url, json={}, match=[
-            responses.json_params_matcher({
-                "permission_type": ["can_read", "can_update"],
-                "assignable": {"id": 666, "type": "User"},
-                "permitable": {"id": 47, "type": "Asset"}
-            })]
-        )
+        responses.add(responses.POST, url, json={}, match=[_RW_PERMISSIONS_MATCHER])
 
-        ok = api_client.set_rw_permissions(asset_id=Asset(47).asset_id, user_id=666)
+        ok = api_client.set_rw_permissions(asset_id=47, user_id=666)
         assert ok
 
     @responses.activate
@@ -372,44 +710,7 @@ class TestMockedNetilionApiClient:
     @responses.activate
     def test_get_asset_values_history(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = "https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page=1&per_page=1000"
-        responses.add(responses.GET, url, json={
-            "key": "alcohol_balling",
-            "unit": {
-                "id": 8612,
-                "href": "https://api.staging-env.netilion.endress.com/v1/units/8612"
-            },
-            "latest": -0.17572078817507417,
-            "min": -3.1412830460507917,
-            "max": 43.639857800823826,
-            "mean": 11.63084701425248,
-            "data": [
-                {
-                    "timestamp": "2022-01-19T14:00:15.202Z",
-                    "value": 43.639857800823826
-                },
-                {
-                    "timestamp": "2022-01-19T14:21:17.211Z",
-                    "value": -3.1412830460507917
-                },
-                {
-                    "timestamp": "2022-01-19T14:22:17.24Z",
-                    "value": 28.460037110165224
-                },
-                {
-                    "timestamp": "2022-01-19T14:38:43.294Z",
-                    "value": 6.331548934579579
-                },
-                {
-                    "timestamp": "2022-01-19T14:40:29.1Z",
-                    "value": 7.179125310495604
-                },
-            ],
-            "pagination": {
-                "page_count": 4,
-                "per_page": 500,
-                "page": 1
-            }
-        })
+        responses.add(responses.GET, url, json=_ALCOHOL_HISTORY_BODY)
 
         asset_values_history, pagination = api_client.get_asset_values_history(1, "alcohol", "2022-01-19T14:00:00",
                                                                                "2022-01-24T09:00:00")
@@ -427,101 +728,112 @@ class TestMockedNetilionApiClient:
         assert pagination.page == 1
 
     @responses.activate
-    def test_get_last_asset_values(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = "https://host.local/v1//assets/1/values/alcohol?to=2022-01-24T09:00:00&order_by=-timestamp"
+    def test_get_asset_values_history_decodes_once(self, configuration, api_client, capture_oauth_token):
+        url = "https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page=1&per_page=1000"
         responses.add(responses.GET, url, json={
-            "key": "alcohol_balling",
-            "unit": {
-                "id": 8612,
-                "href": "https://api.staging-env.netilion.endress.com/v1/units/8612"
-            },
-            "latest": -0.17572078817507417,
-            "min": -3.1412830460507917,
-            "max": 43.639857800823826,
-            "mean": 11.63084701425248,
-            "data": [
-                {
-                    "timestamp": "2022-01-19T14:00:15.202Z",
-                    "value": 43.639857800823826
-                },
-                {
-                    "timestamp": "2022-01-19T14:21:17.211Z",
-                    "value": -3.1412830460507917
-                },
-                {
-                    "timestamp": "2022-01-19T14:22:17.24Z",
-                    "value": 28.460037110165224
-                },
-                {
-                    "timestamp": "2022-01-19T14:38:43.294Z",
-                    "value": 6.331548934579579
-                },
-                {
-                    "timestamp": "2022-01-19T14:40:29.1Z",
-                    "value": 7.179125310495604
-                },
-            ],
-            "pagination": {
-                "page_count": 4,
-                "per_page": 500,
-                "page": 1
-            }
+            "data": [{"timestamp": "2022-01-19T14:00:15.202Z", "value": 1.5}],
+            "pagination": {"page_count": 1, "per_page": 1000, "page": 1}
         })
+        api_client.fetch_token()
+        with patch("netilion.client.codec.loads", wraps=codec.loads) as loads_mock:
+            asset_values_history, pagination = api_client.get_asset_values_history(1, "alcohol", "2022-01-19T14:00:00",
+                                                                                   "2022-01-24T09:00:00")
+        assert loads_mock.call_count == 1
+        assert [value.value for value in asset_values_history] == [1.5]
+        assert pagination.page_count == 1
+
+    def test_json_stream(self):
+        response = MagicMock()
+        response.iter_content.return_value = iter([b'{"data": [1, ', b'2.5], "pagination"', b': null}'])
+        assert NetilionTechnicalApiClient._json_stream(response) == {"data": [1, 2.5], "pagination": None}
+        response.iter_content.assert_called_once_with(chunk_size=65536)
+
+    @responses.activate
+    def test_iter_asset_values_history(self, configuration, api_client, capture_oauth_token, client_application_response):
+        for page in (1, 2, 3):
+            url = f"https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page={page}&per_page=1000"
+            responses.add(responses.GET, url, json={
+                "data": [
+                    {"timestamp": f"2022-01-19T14:0{page}:15.202Z", "value": page * 10},
+                    {"timestamp": f"2022-01-19T14:0{page}:16.202Z", "value": page * 10 + 1},
+                ],
+                "pagination": {"page_count": 3, "per_page": 2, "page": page}
+            })
+        api_client.fetch_token()
 
-        asset_values_history = api_client.get_last_asset_values(1, "alcohol", "2022-01-24T09:00:00")
-        assert isinstance(asset_values_history, list)
-        assert len(asset_values_history) == 5
-        assert all(isinstance(value, AssetValuesByKey) for value in asset_values_history)
-        values = [value.value for value in asset_values_history]
-        assert 43.639857800823826 in values
-        assert -3.1412830460507917 in values
-        assert 28.460037110165224 in values
-        assert 6.331548934579579 in values
-        assert 7.179125310495604 in values
+        values = api_client.iter_asset_values_history(1, "alcohol", "2022-01-19T14:00:00", "2022-01-24T09:00:00")
+        assert [value.value for value in values] == [10, 11, 20, 21, 30, 31]
+        # 1 token + 3 pages
+        assert len(responses.calls) == 4
 
     @responses.activate
-    def test_get_last_asset_values_with_from(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = "https://host.local/v1//assets/1/values/alcohol?to=2022-01-24T09:00:00&order_by=-timestamp&from=2022-01-19T14:00:00"
+    def test_iter_asset_values_history_single_page(self, configuration, api_client, capture_oauth_token):
+        url = "https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page=1&per_page=1000"
         responses.add(responses.GET, url, json={
-            "key": "alcohol_balling",
-            "unit": {
-                "id": 8612,
-                "href": "https://api.staging-env.netilion.endress.com/v1/units/8612"
-            },
-            "latest": -0.17572078817507417,
-            "min": -3.1412830460507917,
-            "max": 43.639857800823826,
-            "mean": 11.63084701425248,
-            "data": [
-                {
-                    "timestamp": "2022-01-19T14:00:15.202Z",
-                    "value": 43.639857800823826
-                },
-                {
-                    "timestamp": "2022-01-19T14:21:17.211Z",
-                    "value": -3.1412830460507917
-                },
-                {
-                    "timestamp": "2022-01-19T14:22:17.24Z",
-                    "value": 28.460037110165224
-                },
-                {
-                    "timestamp": "2022-01-19T14:38:43.294Z",
-                    "value": 6.331548934579579
-                },
-                {
-                    "timestamp": "2022-01-19T14:40:29.1Z",
-                    "value": 7.179125310495604
-                },
-            ],
-            "pagination": {
-                "page_count": 4,
-                "per_page": 500,
-                "page": 1
-            }
+            "data": [{"timestamp": "2022-01-19T14:00:15.202Z", "value": 10}],
+            "pagination": {"page_count": 1, "per_page": 1000, "page": 1}
         })
+        api_client.fetch_token()
+
+        values = list(api_client.iter_asset_values_history(1, "alcohol", "2022-01-19T14:00:00", "2022-01-24T09:00:00"))
+        assert [value.value for value in values] == [10]
+        # 1 token + 1 page, nothing prefetched
+        assert len(responses.calls) == 2
 
-        asset_values_history = api_client.get_last_asset_values(1, "alcohol", "2022-01-24T09:00:00", "2022-01-19T14:00:00")
+    @responses.activate
+    def test_iter_asset_values_history_prefetch_error(self, configuration, api_client, capture_oauth_token):
+        url = "https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page={page}&per_page=1000"
+        responses.add(responses.GET, url.format(page=1), json={
+            "data": [{"timestamp": "2022-01-19T14:00:15.202Z", "value": 10}],
+            "pagination": {"page_count": 2, "per_page": 1, "page": 1}
+        })
+        responses.add(responses.GET, url.format(page=2), json={
+            "errors": [{"type": "not_found_no_permission"}]
+        })
+        api_client.fetch_token()
+
+        values = api_client.iter_asset_values_history(1, "alcohol", "2022-01-19T14:00:00", "2022-01-24T09:00:00")
+        assert next(values).value == 10
+        with pytest.raises(BadNetilionApiPermission):
+            next(values)
+
+    @responses.activate
+    def test_iter_asset_values_history_abandoned(self, configuration, api_client, capture_oauth_token):
+        url = "https://host.local/v1//assets/1/values/alcohol?from=2022-01-19T14:00:00&to=2022-01-24T09:00:00&page={page}&per_page=1000"
+        responses.add(responses.GET, url.format(page=1), json={
+            "data": [{"timestamp": "2022-01-19T14:00:15.202Z", "value": 10}],
+            "pagination": {"page_count": 2, "per_page": 1, "page": 1}
+        })
+        prefetch_started = threading.Event()
+        release_prefetch = threading.Event()
+
+        def slow_page(request):
+            prefetch_started.set()
+            release_prefetch.wait(5)
+            return 200, {}, json.dumps({"data": [], "pagination": {"page_count": 2, "per_page": 1, "page": 2}})
+
+        responses.add_callback(responses.GET, url.format(page=2), callback=slow_page)
+        api_client.fetch_token()
+
+        values = api_client.iter_asset_values_history(1, "alcohol", "2022-01-19T14:00:00", "2022-01-24T09:00:00")
+        assert next(values).value == 10
+        assert prefetch_started.wait(5)
+        # closing the generator must not wait for the in-flight prefetch
+        values.close()
+        assert not release_prefetch.is_set()
+        release_prefetch.set()
+
+    @pytest.mark.parametrize("from_timestamp, query", [
+        (None, "to=2022-01-24T09:00:00&order_by=-timestamp"),
+        ("2022-01-19T14:00:00", "to=2022-01-24T09:00:00&order_by=-timestamp&from=2022-01-19T14:00:00"),
+    ])
+    @responses.activate
+    def test_get_last_asset_values(self, configuration, api_client, capture_oauth_token, client_application_response,
+                                   from_timestamp, query):
+        url = f"https://host.local/v1//assets/1/values/alcohol?{query}"
+        responses.add(responses.GET, url, json=_ALCOHOL_HISTORY_BODY)
+
+        asset_values_history = api_client.get_last_asset_values(1, "alcohol", "2022-01-24T09:00:00", from_timestamp)
         assert isinstance(asset_values_history, list)
         assert len(asset_values_history) == 5
         assert all(isinstance(value, AssetValuesByKey) for value in asset_values_history)
@@ -570,11 +882,10 @@ class TestMockedNetilionApiClient:
             "url": "http://host2.local",
             "event_types": ["asset_values_created"]
         })
-        webhook = WebHook("http://host2.local", ["asset_values_created"])
-        new_webhook = api_client.set_webhook(webhook)
+        new_webhook = api_client.set_webhook(_NEW_WEBHOOK)
         assert isinstance(new_webhook, WebHook)
-        assert new_webhook.url == webhook.url
-        assert new_webhook.event_types == webhook.event_types
+        assert new_webhook.url == _NEW_WEBHOOK.url
+        assert new_webhook.event_types == _NEW_WEBHOOK.event_types
         assert new_webhook.api_id
 
     @responses.activate
@@ -586,12 +897,18 @@ class TestMockedNetilionApiClient:
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "DELETE"
 
+    @pytest.mark.parametrize("status", [200, 502])
+    @responses.activate
+    def test_delete_webhook_failure(self, configuration, api_client, capture_oauth_token, status):
+        webhook = WebHook("https://test.com", ["event_a", "event_b"], 99)
+        url = api_client.construct_url(api_client.ENDPOINT.WEBHOOK, {"application_id": 1, "webhook_id": 99})
+        responses.add(responses.DELETE, url, status=status)
+        with pytest.raises(MalformedNetilionApiResponse):
+            api_client.delete_webhook(webhook)
+
     @responses.activate
     def test_find_unit(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.UNITS)
-        params = urllib.parse.urlencode({"code": "absorbance_unit"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
+        responses.add(responses.GET, _FIND_UNIT_URL_ABSORBANCE, json=self._add_pagination_info({
             "units": [
                 {
                     "id": 8409,
@@ -606,10 +923,7 @@ class TestMockedNetilionApiClient:
 
     @responses.activate
     def test_find_unit_inexistent(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.UNITS)
-        params = urllib.parse.urlencode({"code": "elbows"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
+        responses.add(responses.GET, _FIND_UNIT_URL_ELBOWS, json=self._add_pagination_info({
             "units": [],
         }))
         unit = api_client.find_unit("elbows")
@@ -645,6 +959,21 @@ class TestMockedNetilionApiClient:
         unit = api_client.get_unit(2222)
         assert unit.code == "absorbance_unit"
 
+    @responses.activate
+    def test_units_are_cached(self, configuration, api_client, capture_oauth_token):
+        responses.add(responses.GET, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.UNIT, {"unit_id": 8409}),
+                      json={"id": 8409, "code": "absorbance_unit"})
+        responses.add(responses.GET, _FIND_UNIT_URL_ABSORBANCE,
+                      json=self._add_pagination_info({"units": [{"id": 8409, "code": "absorbance_unit"}]}))
+        responses.add(responses.GET, _FIND_UNIT_URL_ELBOWS, json=self._add_pagination_info({"units": []}))
+        for _ in range(3):
+            assert api_client.get_unit(8409).unit_id == 8409
+            assert api_client.find_unit("absorbance_unit").unit_id == 8409
+            assert api_client.find_unit("elbows") is None
+        unit_calls = [call for call in responses.calls if "/units" in call.request.url]
+        # unknown codes aren't cached, they may be looked up again
+        assert len(unit_calls) == 5
+
     @responses.activate
     def test_push_asset_values_unit_id(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": 1})
@@ -697,6 +1026,54 @@ class TestMockedNetilionApiClient:
         asset_values = AssetValues(Asset(1), [asset])
         api_client.push_asset_values(asset_values)
 
+    @responses.activate
+    def test_push_asset_values_bulk(self, configuration, api_client, capture_oauth_token, client_application_response):
+        for asset_id, expected_values in ((1, [
+            {"key": "k1", "data": [{"value": 1}, {"value": 2}], "unit": {"id": 12345}},
+            {"key": "k2", "data": [{"value": 3}], "unit": {"id": 12346}},
+        ]), (2, [
+            {"key": "k1", "data": [{"value": 4}], "unit": {"id": 12345}},
+        ])):
+            url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": asset_id})
+            responses.add(responses.POST, url, status=204, match=[
+                responses.json_params_matcher({"values": expected_values})
+            ])
+        first_asset = AssetValues(Asset(1), [AssetValue("k1", Unit(12345), 1), AssetValue("k2", Unit(12346), 3)])
+        second_asset = AssetValues(Asset(2), [AssetValue("k1", Unit(12345), 4)])
+        first_asset_again = AssetValues(Asset(1), [AssetValue("k1", Unit(12345), 2)])
+        api_client.fetch_token()
+
+        api_client.push_asset_values_bulk([first_asset, second_asset, first_asset_again])
+        # 1 token + 1 POST per asset
+        assert len(responses.calls) == 3
+        # the caller's objects are left untouched
+        assert len(first_asset.values) == 2
+
+    @responses.activate
+    def test_push_asset_values_bulk_partial_failure(self, configuration, api_client, capture_oauth_token, client_application_response):
+        responses.add(responses.POST, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": 1}),
+                      status=204)
+        responses.add(responses.POST, api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": 2}),
+                      status=400, json={"errors": [{"type": "invalid", "message": "nope"}]})
+        api_client.fetch_token()
+
+        with pytest.raises(PartialNetilionApiFailure) as exc_info:
+            api_client.push_asset_values_bulk([
+                AssetValues(Asset(1), [AssetValue("k1", Unit(12345), 1)]),
+                AssetValues(Asset(2), [AssetValue("k1", Unit(12345), 2)]),
+            ])
+        assert list(exc_info.value.failures) == [2]
+        assert isinstance(exc_info.value.failures[2], MalformedNetilionApiResponse)
+        # both assets were attempted
+        assert len(responses.calls) == 3
+
+    def test_push_asset_values_bulk_conflicting_units(self, api_client):
+        with pytest.raises(MalformedNetilionApiRequest):
+            api_client.push_asset_values_bulk([
+                AssetValues(Asset(1), [AssetValue("k1", Unit(12345), 1)]),
+                AssetValues(Asset(1), [AssetValue("k1", Unit(code="percent"), 2)]),
+            ])
+
     @responses.activate
     def test_get_asset_systems(self, configuration, api_client, capture_oauth_token, client_application_response):
         base_url = api_client.construct_url(api_client.ENDPOINT.ASSET_SYSTEMS, {"asset_id": 99})
@@ -710,9 +1087,7 @@ class TestMockedNetilionApiClient:
             ]
         }))
         systems = api_client.get_asset_systems(99)
-        assert len(systems) == 1
-        assert systems[0].system_id == 0xc0fefe
-        assert systems[0].specifications[0].get("id") == 1
+        assert [(system.system_id, system.specifications[0].get("id")) for system in systems] == [(0xc0fefe, 1)]
 
     @responses.activate
     def test_get_node_specifications(self, configuration, api_client, capture_oauth_token, client_application_response):
@@ -733,9 +1108,7 @@ class TestMockedNetilionApiClient:
             ]
         }))
         node_specifications = api_client.get_node_specifications("node_name")
-        assert len(node_specifications) == 1
-        assert node_specifications[0].node_id == 99
-        assert node_specifications[0].specifications["secret"]["value"] == "1234"
+        assert [(node.node_id, node.specifications["secret"]["value"]) for node in node_specifications] == [(99, "1234")]
 
     @responses.activate
     def test_push_node(self, configuration, api_client, capture_oauth_token, client_application_response):
@@ -782,8 +1155,7 @@ class TestMockedNetilionApiClient:
             }]
         }))
         health_conditions = api_client.get_asset_health_conditions(0xa1)
-        assert len(health_conditions) == 1
-        assert health_conditions[0].diagnosis_code == "T001"
+        assert [condition.diagnosis_code for condition in health_conditions] == ["T001"]
 
     @responses.activate
     def test_get_health_condition(self, configuration, api_client, capture_oauth_token, client_application_response):
@@ -801,65 +1173,32 @@ class TestMockedNetilionApiClient:
         cond = api_client.get_asset_health_condition(0xc0)
         assert cond.diagnosis_code == "T001"
 
+    @pytest.mark.parametrize("status, error", _SUCCESS_OR_BAD_REQUEST)
     @responses.activate
-    def test_post_health_conditions_success(self, configuration, api_client, capture_oauth_token, client_application_response):
+    def test_post_health_conditions(self, configuration, api_client, capture_oauth_token, client_application_response,
+                                    status, error):
         url = api_client.construct_url(api_client.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": 1234})
-        responses.add(responses.POST, url, status=204, match=[responses.json_params_matcher({
-            "health_conditions": [
-                {"id": 9999},
-                {"id": 100}
-            ]
-        })])
+        responses.add(responses.POST, url, status=status, match=[_HEALTH_CONDITIONS_MATCHER])
 
-        api_client.post_asset_health_conditions(1234, [9999, 100])
+        with pytest.raises(error) if error else nullcontext():
+            api_client.post_asset_health_conditions(1234, [9999, 100])
 
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "POST"
 
+    @pytest.mark.parametrize("status, error", _SUCCESS_OR_BAD_REQUEST)
     @responses.activate
-    def test_post_health_conditions_failure(self, configuration, api_client, capture_oauth_token,
-                                            client_application_response):
+    def test_delete_health_conditions(self, configuration, api_client, capture_oauth_token, client_application_response,
+                                      status, error):
         url = api_client.construct_url(api_client.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": 1234})
-        responses.add(responses.POST, url, status=400, match=[responses.json_params_matcher({
-            "health_conditions": [
-                {"id": 9999},
-                {"id": 100}
-            ]
-        })])
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.post_asset_health_conditions(1234, [9999, 100])
+        responses.add(responses.DELETE, url, status=status, match=[_HEALTH_CONDITIONS_MATCHER])
 
-    @responses.activate
-    def test_delete_health_conditions_success(self, configuration, api_client, capture_oauth_token,
-                                            client_application_response):
-        url = api_client.construct_url(api_client.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": 1234})
-        responses.add(responses.DELETE, url, status=204, match=[responses.json_params_matcher({
-            "health_conditions": [
-                {"id": 9999},
-                {"id": 100}
-            ]
-        })])
-
-        api_client.delete_asset_health_conditions(1234, [9999, 100])
+        with pytest.raises(error) if error else nullcontext():
+            api_client.delete_asset_health_conditions(1234, [9999, 100])
 
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "DELETE"
 
-    @responses.activate
-    def test_delete_health_conditions_failure(self, configuration, api_client, capture_oauth_token,
-                                            client_application_response):
-        url = api_client.construct_url(api_client.ENDPOINT.ASSET_HEALTH_CONDITIONS, {"asset_id": 1234})
-        responses.add(responses.DELETE, url, status=400, match=[responses.json_params_matcher({
-            "health_conditions": [
-                {"id": 9999},
-                {"id": 100}
-            ]
-        })])
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.delete_asset_health_conditions(1234, [9999, 100])
-
     @responses.activate
     def test_bad_api_response_post_node(self, configuration, api_client, capture_oauth_token):
         url = api_client.construct_url(api_client.ENDPOINT.NODES)
@@ -874,58 +1213,48 @@ class TestMockedNetilionApiClient:
         with pytest.raises(MalformedNetilionApiRequest):
             api_client.patch_node_specification(99, "key", "value")
 
-    @responses.activate
-    def test_bad_api_response_applications(self, configuration, api_client, capture_oauth_token):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATIONS)
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "client_applications": [{
-                "name": "app1"
-            }]
-        }))
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_applications()
-
-    @responses.activate
-    def test_bad_api_response_application(self, configuration, api_client, capture_oauth_token):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION, {"application_id": 1})
-        responses.add(responses.GET, url, json={
-            # id missing
-            "name": "app1"
-        })
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_application(1)
-
-    @responses.activate
-    def test_bad_api_response_get_assets(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "assets": [{
-                # id missing
-                "serial": 0xdeadbeef
-            }]
-        }))
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_assets()
-
-    @responses.activate
-    def test_bad_api_response_get_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": 1})
-        responses.add(responses.GET, url, json={
-            # id missing
-            "serial": 0xdeadbeef
-        })
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_asset(1)
-
-    @responses.activate
-    def test_bad_api_response_create_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
-        responses.add(responses.POST, url, json={
-            # id missing
-            "serial": 0xdeadbeef
-        })
+    @pytest.mark.parametrize("method, endpoint, url_values, payload, paginated, api_call", [
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATIONS, None,
+                     {"client_applications": [{"name": "app1"}]}, True,
+                     lambda api_client: api_client.get_applications(), id="get_applications_missing_id"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.CLIENT_APPLICATION, {"application_id": 1},
+                     {"name": "app1"}, False,
+                     lambda api_client: api_client.get_application(1), id="get_application_missing_id"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.ASSETS, None,
+                     {"assets": [{"serial": 0xdeadbeef}]}, True,
+                     lambda api_client: api_client.get_assets(), id="get_assets_missing_id"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.ASSET, {"asset_id": 1},
+                     {"serial": 0xdeadbeef}, False,
+                     lambda api_client: api_client.get_asset(1), id="get_asset_missing_id"),
+        pytest.param(responses.POST, NetilionTechnicalApiClient.ENDPOINT.ASSETS, None,
+                     {"serial": 0xdeadbeef}, False,
+                     lambda api_client: api_client.create_asset("sn", 0x11d), id="create_asset_missing_id"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": 1},
+                     {"values": [{"key": "k1", "value": 0xff}]}, False,
+                     lambda api_client: api_client.get_asset_values(1), id="get_asset_values_missing_unit"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.WEBHOOKS, {"application_id": 1},
+                     {"webhooks": [{"url": "http://host.local", "id": 1}]}, True,
+                     lambda api_client: api_client.get_webhooks(), id="get_webhooks_missing_event_types"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.WEBHOOK, {"application_id": 1, "webhook_id": 1},
+                     {"id": 1, "url": "http://host.local"}, False,
+                     lambda api_client: api_client.get_webhook(1), id="get_webhook_missing_event_types"),
+        pytest.param(responses.POST, NetilionTechnicalApiClient.ENDPOINT.WEBHOOKS, {"application_id": 1},
+                     {"id": 2, "url": "http://host2.local"}, False,
+                     lambda api_client: api_client.set_webhook(_NEW_WEBHOOK), id="set_webhook_missing_event_types"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.UNIT, {"unit_id": 1},
+                     {"name": "näme"}, False,
+                     lambda api_client: api_client.get_unit(1), id="get_unit_missing_id_and_code"),
+        pytest.param(responses.GET, NetilionTechnicalApiClient.ENDPOINT.ASSET_SYSTEMS, {"asset_id": 99},
+                     {"systems": [{"specifications": [{"id": 1, "thinga": "magicks"}]}]}, True,
+                     lambda api_client: api_client.get_asset_systems(99), id="get_asset_systems_missing_id"),
+    ])
+    @responses.activate
+    def test_bad_api_response(self, configuration, api_client, capture_oauth_token,
+                              method, endpoint, url_values, payload, paginated, api_call):
+        url = api_client.construct_url(endpoint, url_values)
+        responses.add(method, url, json=self._add_pagination_info(payload) if paginated else payload)
         with pytest.raises(MalformedNetilionApiResponse):
-            api_client.create_asset("sn", 0x11d)
+            api_call(api_client)
 
     @responses.activate
     def test_bad_api_response_delete_asset(self, configuration, api_client, capture_oauth_token, client_application_response):
@@ -949,66 +1278,10 @@ class TestMockedNetilionApiClient:
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.PERMISSIONS)
         responses.add(responses.POST, url, json={
             "errors": [{"type": "taken"}]
-        }, match=[
-            responses.json_params_matcher({
-                "permission_type": ["can_read", "can_update"],
-                "assignable": {"id": 666, "type": "User"},
-                "permitable": {"id": 47, "type": "Asset"}
-            })],
-          status=400
-        )
-        ok = api_client.set_rw_permissions(asset_id=Asset(47).asset_id, user_id=666)
+        }, match=[_RW_PERMISSIONS_MATCHER], status=400)
+        ok = api_client.set_rw_permissions(asset_id=47, user_id=666)
         assert not ok
 
-    @responses.activate
-    def test_bad_api_response_asset_values(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSET_VALUES, {"asset_id": 1})
-        responses.add(responses.GET, url, json={
-            "values": [{
-                "key": "k1",
-                # unit missing
-                "value": 0xff
-            }]
-        })
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_asset_values(1)
-
-    @responses.activate
-    def test_bad_api_response_get_webhooks(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.WEBHOOKS, {"application_id": 1})
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "webhooks": [{
-                "url": "http://host.local",
-                "id": 1,
-                # event types missing
-            }]
-        }))
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_webhooks()
-
-    @responses.activate
-    def test_bad_api_response_get_webhook(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.WEBHOOK, {"application_id": 1, "webhook_id": 1})
-        responses.add(responses.GET, url, json={
-            "id": 1,
-            "url": "http://host.local",
-            # event types missing
-        })
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_webhook(1)
-
-    @responses.activate
-    def test_bad_api_response_set_webhook(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.WEBHOOKS, {"application_id": 1})
-        responses.add(responses.POST, url, json={
-            "id": 2,
-            "url": "http://host2.local",
-            # event types missing
-        })
-        webhook = WebHook("http://host2.local", ["asset_values_created"])
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.set_webhook(webhook)
-
     @responses.activate
     def test_bad_api_request_set_webhook(self, configuration, api_client, capture_oauth_token, client_application_response):
         url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.WEBHOOKS, {"application_id": 1})
@@ -1017,9 +1290,8 @@ class TestMockedNetilionApiClient:
                 {'type': 'n/a', 'message': "don't know yet what this might be, be we check for the status code anyway"}
             ]
         }))
-        webhook = WebHook("http://host2.local", ["asset_values_created"])
         with pytest.raises(MalformedNetilionApiRequest):
-            api_client.set_webhook(webhook)
+            api_client.set_webhook(_NEW_WEBHOOK)
 
     @responses.activate
     def test_bad_api_response_delete_webhook(self, configuration, api_client, capture_oauth_token):
@@ -1029,75 +1301,20 @@ class TestMockedNetilionApiClient:
         with pytest.raises(MalformedNetilionApiResponse):
             api_client.delete_webhook(webhook)
 
-    @responses.activate
-    def test_bad_api_response_get_unit(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.UNIT, {"unit_id": 1})
-        responses.add(responses.GET, url, json={
-            # id and code missing
-            "name": "näme"
-        })
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_unit(1)
-
-    @responses.activate
-    def test_bad_api_response_find_assets_multiple(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.ASSETS)
-        params = urllib.parse.urlencode({"serial_number": "0xdeadbeef"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "assets": [
-                # duplicate asset
-                {
-                    "id": 1,
-                    "serial_number": "0xdeadbeef",
-                    "product": {"id": 1000},
-                },{
-                    "id": 1,
-                    "serial_number": "0xdeadbeef",
-                    "product": {"id": 1000},
-                }
-            ],
-        }))
+    @pytest.mark.parametrize("url, key, record, api_call", [
+        pytest.param(_FIND_ASSET_URL_DEADBEEF, "assets", {"id": 1, "serial_number": "0xdeadbeef", "product": {"id": 1000}},
+                     lambda api_client: api_client.find_asset("0xdeadbeef"), id="find_asset"),
+        pytest.param(_FIND_UNIT_URL_ABSORBANCE, "units",
+                     {"id": 8409, "code": "absorbance_unit", "symbol": "AU", "name": "absorbance unit"},
+                     lambda api_client: api_client.find_unit("absorbance_unit"), id="find_unit"),
+    ])
+    @responses.activate
+    def test_bad_api_response_find_multiple(self, configuration, api_client, capture_oauth_token, client_application_response,
+                                            url, key, record, api_call):
+        # duplicate record
+        responses.add(responses.GET, url, json=self._add_pagination_info({key: [record, record]}))
         with pytest.raises(InvalidNetilionApiState):
-            api_client.find_asset("0xdeadbeef")
-
-    @responses.activate
-    def test_bad_api_response_find_unit_multiple(self, configuration, api_client, capture_oauth_token, client_application_response):
-        base_url = api_client.construct_url(NetilionTechnicalApiClient.ENDPOINT.UNITS)
-        params = urllib.parse.urlencode({"code": "absorbance_unit"})
-        url = f"{base_url}?{params}"
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "units": [
-                # duplicate unit
-                {
-                    "id": 8409,
-                    "code": "absorbance_unit",
-                    "symbol": "AU",
-                    "name": "absorbance unit"
-                }, {
-                    "id": 8409,
-                    "code": "absorbance_unit",
-                    "symbol": "AU",
-                    "name": "absorbance unit"
-                }
-            ],
-        }))
-        with pytest.raises(InvalidNetilionApiState):
-            api_client.find_unit("absorbance_unit")
-
-    @responses.activate
-    def test_bad_api_response_get_asset_systems(self, configuration, api_client, capture_oauth_token, client_application_response):
-        url = api_client.construct_url(api_client.ENDPOINT.ASSET_SYSTEMS, {"asset_id": 99})
-        responses.add(responses.GET, url, json=self._add_pagination_info({
-            "systems": [{
-                    # no id
-                    "specifications": [
-                        {"id": 1, "thinga": "magicks"}
-                    ]
-                }]
-        }))
-        with pytest.raises(MalformedNetilionApiResponse):
-            api_client.get_asset_systems(99)
+            api_call(api_client)
 
     @responses.activate
     def test_api_error_response(self, configuration, api_client, capture_oauth_token, client_application_response):
@@ -1171,15 +1388,7 @@ class TestMockedNetilionApiClient:
             "status": {
                 "id": 1
             }
-        }, match=[responses.json_params_matcher({
-            "name": "test_document",
-            "classification": {
-                "id": 1
-            },
-            "status": {
-                "id": 1
-            }
-        })])
+        }, match=[_POST_DOCUMENT_MATCHER])
 
         created_document = api_client.post_document("test_document", DocumentClassification.UNDEFINED, DocumentStatus.UNDEFINED)
 
@@ -1190,15 +1399,7 @@ class TestMockedNetilionApiClient:
     @responses.activate
     def test_post_document_failure(self, configuration, api_client, capture_oauth_token):
         url = "https://host.local/v1//documents"
-        responses.add(responses.POST, url, status=400, match=[responses.json_params_matcher({
-            "name": "test_document",
-            "classification": {
-                "id": 1
-            },
-            "status": {
-                "id": 1
-            }
-        })])
+        responses.add(responses.POST, url, status=400, match=[_POST_DOCUMENT_MATCHER])
 
         with pytest.raises(MalformedNetilionApiRequest):
             api_client.post_document("test_document", DocumentClassification.UNDEFINED, DocumentStatus.UNDEFINED)
@@ -1252,7 +1453,8 @@ class TestMockedNetilionApiClient:
 
         documents = api_client.get_asset_documents(99)
 
-        assert len(documents) == 2
+        assert [(document.document_id, [attachment.attachment_id for attachment in document.attachments])
+                for document in documents] == [(1234, [98, 99]), (5678, [97])]
 
     @responses.activate
     def test_get_asset_documents_failure(self, configuration, api_client, capture_oauth_token):
@@ -1262,10 +1464,11 @@ class TestMockedNetilionApiClient:
         with pytest.raises(MalformedNetilionApiRequest):
             api_client.get_asset_documents(99)
 
+    @pytest.mark.parametrize("status, error", _SUCCESS_OR_BAD_REQUEST)
     @responses.activate
-    def test_post_asset_document_success(self, configuration, api_client, capture_oauth_token):
+    def test_post_asset_document(self, configuration, api_client, capture_oauth_token, status, error):
         url = "https://host.local/v1//assets/99/documents"
-        responses.add(responses.POST, url, status=204, match=[responses.json_params_matcher({
+        responses.add(responses.POST, url, status=status, match=[responses.json_params_matcher({
             "documents": [
                 {
                     "id": 1234
@@ -1273,25 +1476,12 @@ class TestMockedNetilionApiClient:
             ]
         })])
 
-        api_client.post_asset_document(99, 1234)
+        with pytest.raises(error) if error else nullcontext():
+            api_client.post_asset_document(99, 1234)
 
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "POST"
 
-    @responses.activate
-    def test_post_asset_document_failure(self, configuration, api_client, capture_oauth_token):
-        url = "https://host.local/v1//assets/99/documents"
-        responses.add(responses.POST, url, status=400, match=[responses.json_params_matcher({
-            "documents": [
-                {
-                    "id": 1234
-                }
-            ]
-        })])
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.post_asset_document(99, 1234)
-
     @responses.activate
     def test_download_json_attachment_success(self, configuration, api_client, capture_oauth_token):
         url = "https://host.local/v1//attachments/99/download"
@@ -1355,8 +1545,9 @@ class TestMockedNetilionApiClient:
         with pytest.raises(MalformedNetilionApiRequest):
             api_client.upload_json_attachment(attachment, "test_attachment.json", 1234)
 
+    @pytest.mark.parametrize("status, error", _SUCCESS_OR_BAD_REQUEST)
     @responses.activate
-    def test_patch_json_attachment_success(self, configuration, api_client, capture_oauth_token):
+    def test_patch_json_attachment(self, configuration, api_client, capture_oauth_token, status, error):
         url = "https://host.local/v1//attachments/666"
         attachment = {
             "test": "testy test",
@@ -1365,66 +1556,37 @@ class TestMockedNetilionApiClient:
                 {"nested_2": "asdf"}
             ]
         }
-        responses.add(responses.PATCH, url, status=204)
+        responses.add(responses.PATCH, url, status=status)
 
-        api_client.patch_json_attachment(attachment, 666, "test_attachment.json")
+        with pytest.raises(error) if error else nullcontext():
+            api_client.patch_json_attachment(attachment, 666, "test_attachment.json")
 
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "PATCH"
 
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    @pytest.mark.parametrize("status, error", _OK_OR_BAD_REQUEST)
     @responses.activate
-    def test_patch_json_attachment_failure(self, configuration, api_client, capture_oauth_token):
-        url = "https://host.local/v1//attachments/666"
-        attachment = {
-            "test": "testy test",
-            "array": [
-                {"nested": 9876},
-                {"nested_2": "asdf"}
-            ]
-        }
-        responses.add(responses.PATCH, url, status=400)
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.patch_json_attachment(attachment, 666, "test_attachment.json")
-
-    @responses.activate
-    def test_get_asset_specifications_success(self, configuration, api_client, capture_oauth_token):
+    def test_get_asset_specifications(self, configuration, api_client, capture_oauth_token, status, error, count):
         url = "https://host.local/v1//assets/99/specifications"
-        responses.add(responses.GET, url, status=200, json={
-            "eh.pcps.connection.standard": {
-                "value": "802.11ax",
+        responses.add(responses.GET, url, status=status, json={
+            f"eh.pcps.key_{i}": {
+                "value": str(i),
                 "ui_visible": False,
                 "updated_at": "2022-07-06T11:49:57.092Z"
-            },
-            "eh.pcps.connection.type": {
-                "value": "wifi",
-                "ui_visible": False,
-                "updated_at": "2022-07-06T11:49:57.085Z"
-            },
-            "eh.pcps.values.exist": {
-                "value": "true",
-                "ui_visible": False,
-                "updated_at": "2021-11-03T12:42:57.298Z"
-            }
+            } for i in range(count)
         })
 
-        specifications = api_client.get_asset_specifications(99)
-
-        assert len(specifications) == 3
+        with pytest.raises(error) if error else nullcontext():
+            specifications = api_client.get_asset_specifications(99)
+            assert [specification.value for specification in specifications] == [str(i) for i in range(count)]
 
+    @pytest.mark.parametrize("status, error", _SUCCESS_OR_BAD_REQUEST)
     @responses.activate
-    def test_get_asset_specifications_invalid_request(self, configuration, api_client, capture_oauth_token):
+    def test_patch_asset_specification(self, configuration, api_client, capture_oauth_token, client_application_response,
+                                       status, error):
         url = "https://host.local/v1//assets/99/specifications"
-        responses.add(responses.GET, url, status=400)
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.get_asset_specifications(99)
-
-    @responses.activate
-    def test_patch_asset_specification_success(self, configuration, api_client, capture_oauth_token,
-                                      client_application_response):
-        url = "https://host.local/v1//assets/99/specifications"
-        responses.add(responses.PATCH, url, status=204, match=[responses.json_params_matcher({
+        responses.add(responses.PATCH, url, status=status, match=[responses.json_params_matcher({
             "test_key_1": {
                 "value": "test_value_1",
                 "unit": "metre_per_second",
@@ -1440,25 +1602,17 @@ class TestMockedNetilionApiClient:
             Specification("test_key_2", "test_value_2")
             ]
 
-        api_client.patch_asset_specifications(99, specifications)
+        with pytest.raises(error) if error else nullcontext():
+            api_client.patch_asset_specifications(99, specifications)
 
         assert responses.calls[1].request.url == url
         assert responses.calls[1].request.method == "PATCH"
 
+    @pytest.mark.parametrize("status, error", _OK_OR_BAD_REQUEST)
     @responses.activate
-    def test_patch_asset_specification_failure(self, configuration, api_client, capture_oauth_token,
-                                               client_application_response):
-        url = "https://host.local/v1//assets/99/specifications"
-        responses.add(responses.PATCH, url, status=400, match=[responses.json_params_matcher({})])
-        specifications = []
-
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.patch_asset_specifications(99, specifications)
-
-    @responses.activate
-    def test_get_node_assets_success(self, configuration, api_client, capture_oauth_token):
+    def test_get_node_assets(self, configuration, api_client, capture_oauth_token, status, error):
         url = "https://host.local/v1//nodes/99/assets"
-        responses.add(responses.GET, url, status=200, json=self._add_pagination_info({
+        responses.add(responses.GET, url, status=status, json=self._add_pagination_info({
             "assets": [{
                 "serial_number": "asset_1",
                 "id": 1
@@ -1467,20 +1621,15 @@ class TestMockedNetilionApiClient:
                 "id": 2
             }]
         }))
-        assets = api_client.get_node_assets(99)
-        assert len(assets) == 2
+        with pytest.raises(error) if error else nullcontext():
+            assets = api_client.get_node_assets(99)
+            assert len(assets) == 2
 
+    @pytest.mark.parametrize("status, error", _OK_OR_BAD_REQUEST)
     @responses.activate
-    def test_get_node_assets_failure(self, configuration, api_client, capture_oauth_token):
-        url = "https://host.local/v1//nodes/99/assets"
-        responses.add(responses.GET, url, status=400)
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.get_node_assets(99)
-
-    @responses.activate
-    def test_get_nodes_success(self, configuration, api_client, capture_oauth_token):
+    def test_get_nodes(self, configuration, api_client, capture_oauth_token, status, error):
         url = "https://host.local/v1//nodes"
-        responses.add(responses.GET, url, status=200, json=self._add_pagination_info({
+        responses.add(responses.GET, url, status=status, json=self._add_pagination_info({
             "nodes": [
                 {
                     "name": "node_1",
@@ -1520,12 +1669,6 @@ class TestMockedNetilionApiClient:
                 }
             ]
         }))
-        nodes = api_client.get_nodes()
-        assert len(nodes) == 2
-
-    @responses.activate
-    def test_get_nodes_failure(self, configuration, api_client, capture_oauth_token):
-        url = "https://host.local/v1//nodes"
-        responses.add(responses.GET, url, status=400)
-        with pytest.raises(MalformedNetilionApiRequest):
-            api_client.get_nodes()
+        with pytest.raises(error) if error else nullcontext():
+            nodes = api_client.get_nodes()
+            assert len(nodes) == 2
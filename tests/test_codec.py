@@ -0,0 +1,53 @@
+# pylint: skip-file
+import importlib
+import json
+import math
+import sys
+
+import pytest
+
+from netilion import codec
+
+
+class TestCodec:
+
+    @pytest.fixture(params=["orjson", "json"])
+    def json_codec(self, request, monkeypatch):
+        if request.param == "json":
+            # pretend orjson is not installed
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        else:
+            pytest.importorskip("orjson")
+        yield importlib.reload(codec)
+        monkeypatch.undo()
+        importlib.reload(codec)
+
+    def test_loads(self, json_codec):
+        assert json_codec.loads(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+        assert json_codec.loads('{"a": null}') == {"a": None}
+        assert json_codec.loads(memoryview(bytearray(b'[true]'))) == [True]
+
+    def test_loads_invalid(self, json_codec):
+        with pytest.raises(ValueError):
+            json_codec.loads(b'<html></html>')
+
+    def test_dumps(self, json_codec):
+        dumped = json_codec.dumps({"a": [1, 2.5, "x"], "b": None})
+        assert isinstance(dumped, bytes)
+        assert json_codec.loads(dumped) == {"a": [1, 2.5, "x"], "b": None}
+
+    def test_dumps_non_str_keys(self, json_codec):
+        assert json.loads(json_codec.dumps({1: "a", "b": {2: None}})) == {"1": "a", "b": {"2": None}}
+
+    def test_dumps_big_int(self, json_codec):
+        big = 2 ** 70
+        assert json.loads(json_codec.dumps({"value": big, "values": [-big]})) == {"value": big, "values": [-big]}
+
+    @pytest.mark.parametrize("value, encoded", [(math.nan, b"NaN"), (math.inf, b"Infinity"), (-math.inf, b"-Infinity")])
+    def test_dumps_non_finite(self, json_codec, value, encoded):
+        # NaN sensor readings must not silently become null
+        assert json_codec.dumps({"values": [{"value": value}, None], "x": (1.0,)}) == \
+               b'{"values":[{"value":' + encoded + b'},null],"x":[1.0]}'
+
+    def test_dumps_null_without_non_finite(self, json_codec):
+        assert json_codec.dumps({"values": [None, 1.5, "a"]}) == b'{"values":[null,1.5,"a"]}'
@@ -21,3 +21,20 @@ class TestConfiguration:
     def test_auto_oauth_token_url(self):
         conf = ConfigurationParameters("https://host.local", "clientid", "clientsecret", "user", "pass")
         assert conf.oauth_token_url == "https://host.local/oauth/token/"
+
+    def test_default_pool_sizes(self):
+        conf = ConfigurationParameters("https://host.local", "clientid", "clientsecret", "user", "pass")
+        assert conf.pool_connections == 20
+        assert conf.pool_maxsize == 50
+
+    def test_custom_pool_sizes(self):
+        conf = ConfigurationParameters("https://host.local", "clientid", "clientsecret", "user", "pass",
+                                       pool_connections=4, pool_maxsize=8)
+        assert conf.pool_connections == 4
+        assert conf.pool_maxsize == 8
+
+    def test_slots(self):
+        configuration = ConfigurationParameters.get_empty()
+        assert not hasattr(configuration, "__dict__")
+        configuration.client_application_id = "1"
+        assert configuration.client_application_id == "1"
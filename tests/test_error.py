@@ -1,4 +1,7 @@
 # pylint: skip-file
+from unittest.mock import patch
+
+from netilion import codec
 from netilion.error import *
 from requests import Response
 
@@ -32,6 +35,38 @@ class TestError:
 
         assert str(err) == "GenericNetilionApiError: <Response [400]>"
 
+    def test_generic_error_with_invalid_json_response(self):
+        resp = Response()
+        resp.status_code = 502
+        resp.headers = {"Content-Type": "application/json"}
+        resp._content = b'<html>Bad Gateway</html>'
+
+        err = GenericNetilionApiError(resp)
+
+        assert str(err) == "GenericNetilionApiError: <Response [502]>"
+
+    def test_generic_error_with_json_response_without_errors(self):
+        resp = Response()
+        resp.status_code = 400
+        resp.headers = {"Content-Type": "application/json; charset=utf-8"}
+        resp._content = b'[{"type": "error_type"}]'
+
+        err = GenericNetilionApiError(resp)
+
+        assert str(err) == "GenericNetilionApiError: <Response [400]>"
+
+    def test_generic_error_parses_response_once(self):
+        resp = Response()
+        resp.status_code = 400
+        resp.headers = {"Content-Type": "application/json"}
+        resp._content = b'{"errors": [{"type": "error_type"}]}'
+
+        err = GenericNetilionApiError(resp)
+
+        with patch("netilion.error.codec.loads", wraps=codec.loads) as loads_mock:
+            assert str(err) == str(err) == "GenericNetilionApiError: [{'type': 'error_type'}]"
+        loads_mock.assert_called_once()
+
     def test_malformed_api_response_with_json_response(self):
         resp = Response()
         resp.status_code = 400
@@ -41,3 +76,10 @@ class TestError:
         err = MalformedNetilionApiResponse(resp)
 
         assert str(err) == "MalformedNetilionApiResponse: [{'type': 'error_type'}]"
+
+    def test_partial_failure_lists_failures(self):
+        failures = {1: MalformedNetilionApiRequest(msg="bad"), 2: InvalidNetilionApiState(msg="worse")}
+        err = PartialNetilionApiFailure(failures)
+
+        assert err.failures == failures
+        assert str(err) == "2 request(s) failed: 1: bad, 2: worse"
@@ -1,9 +1,11 @@
 # pylint: skip-file
 import datetime
+import logging
+from unittest.mock import patch
 
 import pytest
 
-from netilion.error import MalformedNetilionApiResponse
+from netilion.error import MalformedNetilionApiResponse, BadNetilionApiPermission, QuotaExceeded, GenericNetilionApiError
 from netilion.model import NetilionObject, ClientApplication, WebHook, AssetValue, Asset, AssetValues, AssetValuesByKey, \
     Unit, \
     AssetSystem, AssetHealthCondition, Pagination, NodeSpecification, Document, DocumentClassification, DocumentStatus, \
@@ -72,6 +74,53 @@ class TestModel:
         with pytest.raises(MalformedNetilionApiResponse):
             Specification.parse_multiple_from_api(body, "values")
 
+    def test_parse_multiple_checks_errors_once(self):
+        body = {"assets": [{"id": i} for i in range(5)]}
+        with patch.object(Asset, "raise_errors", wraps=Asset.raise_errors) as raise_errors_mock:
+            assets = Asset.parse_multiple_from_api(body, "assets")
+        assert [asset.asset_id for asset in assets] == list(range(5))
+        raise_errors_mock.assert_called_once_with(body)
+
+    def test_missing_key_warning_formats_lazily(self, caplog):
+        class Body(dict):
+            formatted = 0
+
+            def __str__(self):
+                Body.formatted += 1
+                return super().__str__()
+
+        with caplog.at_level(logging.ERROR, logger="netilion.model"):
+            with pytest.raises(MalformedNetilionApiResponse):
+                Asset.parse_from_api(Body())
+        assert Body.formatted == 0
+        with caplog.at_level(logging.WARNING, logger="netilion.model"):
+            with pytest.raises(MalformedNetilionApiResponse):
+                Asset.parse_from_api(Body())
+        assert Body.formatted >= 1
+        assert "Unable to deserialize Asset, missing key: 'id'" in caplog.text
+
+    @pytest.mark.parametrize("instance", [
+        ClientApplication("name", 1), WebHook("https://test.com", []), Asset(1), Unit(1), AssetValue("k", {"id": 1}, 1),
+        AssetValues(Asset(1), []), AssetValuesByKey(1), AssetSystem(1), AssetHealthCondition(1, "F1"), Node(1),
+        NodeSpecification(1), Specification("k", "v"), Pagination(1, 1, 1),
+        Document(1, "name", DocumentClassification.PUBLIC), Attachment(1, "file", "text/plain")
+    ])
+    def test_models_use_slots(self, instance):
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.not_an_attribute = 1
+
+    @pytest.mark.parametrize("errors, expected", [
+        ([{"type": "quota_exceeded"}, {"type": "not_found_no_permission"}], BadNetilionApiPermission),
+        ([{"type": "other"}, {"type": "quota_exceeded"}], QuotaExceeded),
+        ([{"type": "other"}], GenericNetilionApiError),
+        ([{"type": "not_found_no_permission"}, {"message": "no type"}], MalformedNetilionApiResponse),
+    ])
+    def test_raise_errors(self, errors, expected):
+        with pytest.raises(expected) as exc_info:
+            NetilionObject.raise_errors({"errors": errors})
+        assert type(exc_info.value) is expected
+
     def test_client_equality_object(self):
         app1 = ClientApplication("name", 42)
         app2 = ClientApplication("name", 42)
@@ -145,6 +194,17 @@ class TestModel:
         unit1 = Unit.deserialize({"id": 123, "code": "parsec", "name": "Parsecs"})
         assert unit1 == Unit(unit_id=123, code="parsec", name="Parsecs")
 
+    def test_unit_code_interned(self):
+        code = "".join(["degree_", "celsius"])
+        assert Unit(code=code).code is Unit.unit_by_code("degree_celsius").code
+
+    def test_unit_instances_shared(self):
+        assert Unit.unit_by_code("degree_celsius") is Unit.unit_by_code("degree_celsius")
+        assert Unit.deserialize({"id": 1, "code": "c", "name": "n"}) is Unit.deserialize({"id": 1, "code": "c", "name": "n"})
+        assert Unit.deserialize({"id": 1, "code": "c", "name": "n"}) is not Unit.deserialize({"id": 1, "code": "c"})
+        with pytest.raises(MalformedNetilionApiResponse):
+            Unit.deserialize({"name": "n"})
+
     def test_unit_unit_by_code(self):
         unit = Unit.unit_by_code("metre_per_second")
         assert unit.code == "metre_per_second"
@@ -189,6 +249,29 @@ class TestModel:
         asset_value = AssetValue.deserialize({"key": "k", "unit": {"id": 1, "code": "code", "name": "name"}, "value": 42})
         assert asset_value.unit == Unit(1, "code", "name")
 
+    def test_assetvalue_with_unit_subclass(self):
+        class CustomUnit(Unit):
+            __slots__ = ()
+
+        unit = CustomUnit(code="c")
+        assert AssetValue("k", unit, 42).unit is unit
+
+    def test_empty_specifications_are_shared_and_read_only(self):
+        system, node = AssetSystem(1), NodeSpecification(2)
+        assert system.specifications is node.specifications
+        assert len(system.specifications) == 0
+        with pytest.raises(TypeError):
+            system.specifications["key"] = "value"
+        assert node.serialize() == {"id": 2, "name": "", "hidden": False}
+
+    def test_equality_with_subclass(self):
+        class CustomAsset(Asset):
+            __slots__ = ()
+
+        assert CustomAsset(1) == CustomAsset(1)
+        assert CustomAsset(1) != CustomAsset(2)
+        assert CustomAsset(1) == {"id": 1}
+
     def test_assetvalue_without_timestamp(self):
         asset_value = AssetValue("k", {"id": 1}, 42)
         assert asset_value.serialize() == {"key": "k", "unit": {"id": 1}, "value": 42}
@@ -234,6 +317,12 @@ class TestModel:
         av2 = AssetValue("k", {"id": 1234, "code": "c2", "name": "ñ"}, 42)
         assert av1 != av2
 
+    def test_assetvalue_equality_ignores_timestamp(self):
+        ts = datetime.datetime(2021, 9, 13, 8, 33, 5, tzinfo=datetime.timezone.utc)
+        assert AssetValue("k", {"id": 1}, 42, ts) == AssetValue("k", {"id": 1}, 42)
+        assert AssetValue("k", {"id": 1}, 42, ts) != AssetValue("k", {"id": 1}, 43, ts)
+        assert AssetValue("k", {"id": 1}, 42) != {"key": "k", "unit": {"id": 2}, "value": 42}
+
     def test_assetvaluebykey(self):
         ts: datetime = datetime.datetime.strptime("2020-12-24T23:59:59.123Z", "%Y-%m-%dT%H:%M:%S.%f%z")
         asset_value = AssetValuesByKey(42, timestamp=ts)
@@ -244,6 +333,36 @@ class TestModel:
         assert asset_value.timestamp == datetime.datetime(2021, 9, 13, 8, 33, 5, 178000, tzinfo=datetime.timezone.utc)
         assert asset_value.value == 1
 
+    @pytest.mark.parametrize("timestamp, expected", [
+        (datetime.datetime(2020, 12, 24, 23, 59, 59, 123456, tzinfo=datetime.timezone.utc), "2020-12-24T23:59:59.123Z"),
+        (datetime.datetime(2021, 1, 2, 3, 4, 5, 999999, tzinfo=datetime.timezone.utc), "2021-01-02T03:04:05.999Z"),
+        (datetime.datetime(2021, 1, 1, 0, 30, 0, 1000, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+         "2020-12-31T22:30:00.001Z"),
+    ])
+    def test_serialize_timestamp(self, timestamp, expected):
+        assert AssetValuesByKey(1, timestamp=timestamp).serialize()["timestamp"] == expected
+        assert AssetValue("k", {"id": 1}, 1, timestamp=timestamp).serialize()["timestamp"] == expected
+
+    @pytest.mark.parametrize("timestamp", ["2021-09-13T08:33:05.178Z", "2021-09-13T08:33:05.1Z", "2022-01-19T14:22:17.24Z",
+                                           "2021-09-13T08:33:05.123456Z", "2021-11-04T08:19:35Z", "2021-11-04T08:19:35+02:00",
+                                           "2021-11-04T08:19:35.5-0130", "2021-11-04T08:19:35+00:00"])
+    def test_deserialize_timestamp_matches_strptime(self, timestamp):
+        day_time_format = "%Y-%m-%dT%H:%M:%S.%f%z" if "." in timestamp else "%Y-%m-%dT%H:%M:%S%z"
+        expected = datetime.datetime.strptime(timestamp, day_time_format)
+        parsed = AssetValuesByKey.deserialize_timestamp(timestamp)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+        assert AssetValue.deserialize_timestamp(timestamp) == expected
+
+    @pytest.mark.parametrize("timestamp", ["2021-09-13T08:33:05.178", "2021-09-13 08:33:05Z", "2021-09-13T08:33:05.Z",
+                                           "2021-09-13T08:33:05.1234567Z", "2021-09-13T08:33:05+2", "2021-09-13T08:33:05*02:00",
+                                           "2021-09-13T08:33:05+ab:cd", "2021-13-13T08:33:05Z", "2021-09-13",
+                                           "2021-09-13T08:33:05.1a3Z", "2021-09-13T08:33:05.+01:00"])
+    def test_deserialize_bad_timestamp(self, timestamp):
+        with pytest.raises(ValueError):
+            AssetValuesByKey.deserialize_timestamp(timestamp)
+        assert AssetValue.deserialize_timestamp(timestamp) is None
+
     def test_assetvaluebykey_deserialization_with_timestamp_alternative_format(self):
         asset_value = AssetValuesByKey.deserialize({"value": 1, "timestamp": "2021-11-04T08:19:35Z"})
         assert asset_value.timestamp == datetime.datetime(2021, 11, 4, 8, 19, 35, 0, tzinfo=datetime.timezone.utc)
@@ -263,6 +382,15 @@ class TestModel:
         ])
         assert incoming.serialize() == asset_values_created_webhook_payload
 
+    def test_incomingassetvalues_serialize_interleaved_keys(self):
+        unit_b, unit_a = {"id": 2}, {"id": 1}
+        incoming = AssetValues(Asset(1), [AssetValue("b", unit_b, 1), AssetValue("a", unit_a, 2), AssetValue("b", unit_b, 3),
+                                          AssetValue("a", unit_a, 4)])
+        assert incoming.serialize() == {"asset": {"id": 1}, "values": [
+            {"key": "b", "data": [{"value": 1}, {"value": 3}], "unit": {"id": 2}},
+            {"key": "a", "data": [{"value": 2}, {"value": 4}], "unit": {"id": 1}},
+        ]}
+
     def test_incomingassetvalues_deserialize(self, asset_values_created_webhook_payload):
         incoming = AssetValues.parse_from_api({"content": asset_values_created_webhook_payload})
         assert Asset(1) == incoming.asset
@@ -271,6 +399,19 @@ class TestModel:
         assert AssetValue("k1", {"id": 1}, 2) in incoming.values
         assert AssetValue("k2", {"id": 2}, 3) in incoming.values
 
+    def test_incomingassetvalues_deserialize_shares_unit(self, asset_values_created_webhook_payload):
+        incoming = AssetValues.parse_from_api({"content": asset_values_created_webhook_payload})
+        k1_values = [value for value in incoming.values if value.key == "k1"]
+        assert len(k1_values) == 2
+        assert k1_values[0].unit is k1_values[1].unit
+
+    def test_incomingassetvalues_deserialize_empty_timestamp(self):
+        incoming = AssetValues.deserialize({"content": {"asset": {"id": 1}, "values": [
+            {"key": "k", "unit": {"id": 1}, "data": [{"value": 1, "timestamp": ""}, {"value": 2, "timestamp": None}, {"value": 3}]}
+        ]}})
+        assert [value.timestamp for value in incoming.values] == [None, None, None]
+        assert AssetValue.deserialize({"key": "k", "unit": {"id": 1}, "value": 1, "timestamp": ""}).timestamp is None
+
     def test_incomingassetvalues_equality(self):
         as1 = AssetValues(Asset(1), [
             AssetValue("k1", Unit.unit_by_code("degree_celsius"), 22.0),
@@ -449,6 +590,15 @@ class TestModel:
         assert document.status == DocumentStatus.UNDEFINED
         assert document.attachments == []
 
+    def test_document_deserialization_unknown_classification(self):
+        with pytest.raises(MalformedNetilionApiResponse):
+            Document.parse_from_api({"id": "1234", "name": "test_document", "classification": {"id": 99}, "status": {"id": 1}})
+
+    def test_document_deserialization_bad_attachment(self):
+        with pytest.raises(MalformedNetilionApiResponse):
+            Document.parse_from_api({"id": "1234", "name": "test_document", "classification": {"id": 1}, "status": {"id": 1},
+                                     "attachments": [{"id": 98, "file_name": "test_attachment.json"}]})
+
     def test_document_serialization(self):
         attachments = [Attachment(98, "test_attachment.json", "application/json"),
                        Attachment(99, "test_attachment_2.json", "application/json")]